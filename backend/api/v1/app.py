@@ -4,48 +4,68 @@
 Main Flask application setup for the Pharmacy API.
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dotenv import load_dotenv
-from flask import Flask, abort, request, g
+from flask import Flask
 from flask_bcrypt import Bcrypt
 import logging
 import os
+import sys
 
 from api.v1.auth.session_db_auth import SessionDBAuth
 from api.v1.utils.error_handlers import (
     bad_request, unauthorized, forbidden, not_found, method_not_allowed,
     conflict_error, server_error
 )
-from api.v1.views import app_views
+from api.v1.utils.json_provider import OrjsonProvider
+from api.v1.views import app_views, public_views
 from models import storage
 
 
 load_dotenv()
 logger = logging.getLogger(__name__)
-bcrypt = Bcrypt()
-auth = SessionDBAuth()
 
-def check_authentication():
+CONFIG_NAME = os.getenv("ENV", "development")
+PHARMACY_API_HOST = os.getenv("PHARMACY_API_HOST", "0.0.0.0")
+PHARMACY_API_PORT = int(os.getenv("PHARMACY_API_PORT", 5000))
+DEBUG_MODE = bool(os.getenv("DEBUG_MODE", False))
+# bcrypt's minimum cost under test: each step down halves hashing time,
+# and test passwords protect nothing.
+BCRYPT_LOG_ROUNDS = int(
+    os.getenv("BCRYPT_LOG_ROUNDS", 4 if CONFIG_NAME == "test" else 12)
+)
+BCRYPT_TIMEOUT = 10
+
+
+def create_bcrypt_pool() -> Executor:
     """
-    Verifies session authentication for protected routes.
+    Creates the thread pool used for bcrypt hashing.
+
+    Under gevent, threads are patched into greenlets, which would run
+    bcrypt on the event loop; gevent's own pool uses real OS threads.
     """
-    if not auth.require_auth(
-        request.path,
-        [
-            "/api/v1/register/", "/api/v1/auth_session/login/"
-        ]
-    ):
-        return
-    if not auth.session_cookie():
-        abort(401)
-    
-    employee = auth.current_employee()
-    if not employee:
-        abort(401)
-    g.current_employee = employee
+    gevent_monkey = sys.modules.get("gevent.monkey")
+    if gevent_monkey and gevent_monkey.is_module_patched("threading"):
+        from gevent.threadpool import (
+            ThreadPoolExecutor as GeventThreadPoolExecutor
+        )
+
+        return GeventThreadPoolExecutor(max_workers=os.cpu_count())
+    return ThreadPoolExecutor(
+        max_workers=os.cpu_count(), thread_name_prefix="bcrypt"
+    )
+
+
+bcrypt = Bcrypt()
+bcrypt_pool = create_bcrypt_pool()
+auth = SessionDBAuth()
 
 def close_db(exception: BaseException | None) -> None:
     """
     Closes the database session after each request.
+
+    Requests that never touched the database have no scoped session,
+    so this does no database work for them.
     """
     storage.close()
 
@@ -54,15 +74,17 @@ def create_app(config_name: str | None=None) -> Flask:
     Creates and configures the Flask application instance.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     if config_name == "test":
         app.config.from_mapping(TESTING=True)
     else:
         app.config.from_mapping(TESTING=False)
+    app.config.from_mapping(BCRYPT_LOG_ROUNDS=BCRYPT_LOG_ROUNDS)
 
     bcrypt.init_app(app) # type: ignore
+    app.register_blueprint(public_views)
     app.register_blueprint(app_views)
-    app.before_request(check_authentication)
     app.teardown_appcontext(close_db)
     app.register_error_handler(400, bad_request)
     app.register_error_handler(401, unauthorized)
@@ -75,12 +97,18 @@ def create_app(config_name: str | None=None) -> Flask:
     return app
 
 
-config_name = os.getenv("ENV", "development")
-app = create_app(config_name)
+app = create_app(CONFIG_NAME)
 
 if __name__ == "__main__":
-    host = os.getenv("PHARMACY_API_HOST", "0.0.0.0")
-    port = int(os.getenv("PHARMACY_API_PORT", 5000))
-    debug_mode = bool(os.getenv("DEBUG_MODE", False))
-    app.run(host=host, port=port, threaded=True, debug=debug_mode)
+    if CONFIG_NAME != "development":
+        raise SystemExit(
+            "The Flask dev server is for development only; "
+            "use 'gunicorn wsgi:app' instead."
+        )
+    app.run(
+        host=PHARMACY_API_HOST,
+        port=PHARMACY_API_PORT,
+        threaded=True,
+        debug=DEBUG_MODE
+    )
     
\ No newline at end of file
@@ -5,57 +5,50 @@ Provides base and login authentication logic for employees.
 
 This module defines:
 - BaseAuth: Handles generic authentication utilities
-            (session cookies, path checks).
+            (session cookies, current employee).
 - LoginAuth: Handles employee login validation,
              authentication, and session management.
 """
 
 
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from flask import request, abort
 from typing import cast
+import hashlib
 import logging
 import os
+import threading
 
 from api.v1.utils.request_data_validation import (
     EmployeeLogin,
-    get_request_data,
     validate_request_data,
 )
+from api.v1.utils.utility import run_bcrypt
 from models.employee import Employee
 
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+SESSION_NAME = os.getenv("SESSION_NAME")
+if not SESSION_NAME:
+    raise ValueError("No environment variable for session name.")
+
+VERIFIED_PASSWORD_TTL = int(os.getenv("VERIFIED_PASSWORD_TTL", 300))
+verified_passwords: TTLCache[tuple[str, str, str], bool] = TTLCache(
+    maxsize=10_000, ttl=VERIFIED_PASSWORD_TTL
+)
+verified_passwords_lock = threading.Lock()
+
 
 class BaseAuth:
     """
     Provides foundational authentication utilities such as:
-    - Path-based access control.
     - Retrieving session cookies.
+    - Looking up the current employee.
     """
 
-    def require_auth(self, path: str, excluded_paths: list[str]) -> bool:
-        """
-        Determines if a request path requires authentication.
-
-        Args:
-            path (str): The request path.
-            excluded_paths (list[str]): List of paths that are
-                                        publicly accessible.
-
-        Returns:
-            bool: True if authentication is required, False otherwise.
-        """
-        if not path or not excluded_paths:
-            return True
-        if not path.endswith("/"):
-            path += "/"
-        if path in excluded_paths:
-            return False
-        return True
-
     def session_cookie(self) -> str | None:
         """
         Retrieves the session cookie from the incoming request.
@@ -63,11 +56,7 @@ class BaseAuth:
         Returns:
             str | None: The session cookie value, or None if not found.
         """
-        cookie_name = os.getenv("SESSION_NAME")
-        if not cookie_name:
-            logger.error("SESSION_NAME environment variable not set")
-            return
-        return request.cookies.get(cookie_name)
+        return request.cookies.get(cast(str, SESSION_NAME))
 
     def current_employee(self) -> Employee | None:
         """
@@ -89,13 +78,9 @@ class LoginAuth:
 
     def __init__(self) -> None:
         """
-        Initializes the LoginAuth instance and
-        verifies the session cookie name.
+        Initializes the LoginAuth instance with the session cookie name.
         """
-        self.cookie_name = os.getenv("SESSION_NAME")
-        if not self.cookie_name:
-            logger.error("SESSION_NAME environment variable not set")
-            abort(500)
+        self.cookie_name = cast(str, SESSION_NAME)
 
     def validate_login_request_data(self) -> dict[str, str]:
         """
@@ -108,13 +93,9 @@ class LoginAuth:
         Raises:
             400: If neither email nor username is provided.
         """
-        email = get_request_data().get("email")
-        username = get_request_data().get("username")
-
-        if not any([email, username]):
-            abort(400, description="Must have either email or username")
-
         valid_data = validate_request_data(EmployeeLogin)
+        if not valid_data.get("email") and not valid_data.get("username"):
+            abort(400, description="Must have either email or username")
 
         return valid_data
 
@@ -122,8 +103,6 @@ class LoginAuth:
         self, email: str | None, username: str | None, password: str | None
     ) -> Employee:
         """Authenticate a user by email or username and password."""
-        from api.v1.app import bcrypt
-
         if not email and not username:
             abort(400, description="Either email or username is required")
         if not password:
@@ -133,13 +112,40 @@ class LoginAuth:
         if not employee:
             abort(404, description="No employee found")
 
-        if not bcrypt.check_password_hash(  # type: ignore
-            employee.password, password
-        ):
+        if not self.check_password(employee, password):
             abort(401, description="wrong password")
 
         return employee
 
+    def check_password(self, employee: Employee, password: str) -> bool:
+        """
+        Verify a password against the employee's stored hash.
+
+        Successful checks are remembered for a short time, keyed by the
+        stored hash so a password change invalidates the entry.
+        """
+        from api.v1.app import bcrypt
+
+        cache_key = (
+            employee.id,
+            employee.password,
+            hashlib.sha256(password.encode("utf-8")).hexdigest(),
+        )
+        with verified_passwords_lock:
+            if cache_key in verified_passwords:
+                return True
+
+        if not run_bcrypt(
+            bcrypt.check_password_hash,  # type: ignore
+            employee.password,
+            password,
+        ):
+            return False
+
+        with verified_passwords_lock:
+            verified_passwords[cache_key] = True
+        return True
+
     def create_employee_session(
             self,
             employee: Employee
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 """
-Decorator for admin-only routes.
+Authentication hook and decorator for protected routes.
 """
 from flask import g, abort
 from typing import Callable, Any, TypeVar, cast
@@ -13,6 +13,22 @@ logger = logging.getLogger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def check_authentication() -> None:
+    """
+    Verifies session authentication for protected routes.
+
+    Registered as the `before_request` hook of the protected blueprint,
+    so public routes never run it.
+    """
+    from api.v1.app import auth
+
+    if not auth.session_cookie():
+        abort(401)
+
+    if not auth.current_employee():
+        abort(401)
+
+
 def admin_only(func: F) -> F:
     """Allow only admin employees to access a route."""
 
@@ -24,7 +40,6 @@ def admin_only(func: F) -> F:
         employee = getattr(g, "current_employee", None)
         if not employee:
             abort(401)
-        employee = g.current_employee
         if not employee.is_admin:
             abort(403)
         return func(*args, **kwargs)
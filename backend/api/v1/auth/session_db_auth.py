@@ -6,7 +6,8 @@ Handles database-backed session authentication for employees.
 
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from flask import abort
+from flask import abort, g
+from sqlalchemy.orm import joinedload
 import logging
 import os
 
@@ -19,6 +20,8 @@ from models.employee_session import EmployeeSession
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+SESSION_DURATION = int(os.getenv("SESSION_DURATION", 0))
+
 
 class SessionDBAuth(BaseAuth):
     """
@@ -27,9 +30,9 @@ class SessionDBAuth(BaseAuth):
 
     def __init__(self) -> None:
         """
-        Initialize session duration from environment.
+        Initialize session duration.
         """
-        self.session_duration = int(os.getenv("SESSION_DURATION", 0))
+        self.session_duration = SESSION_DURATION
 
     def create_session(self, employee_id: str | None = None) -> str | None:
         """
@@ -50,7 +53,13 @@ class SessionDBAuth(BaseAuth):
     def current_employee(self) -> Employee | None:
         """
         Return the employee linked to the current session cookie.
+
+        The result is memoized on `flask.g` so repeated calls within
+        the same request do not hit the database again.
         """
+        if "current_employee" in g:
+            return g.current_employee
+
         session_id = self.session_cookie()
         if not session_id:
             return
@@ -61,6 +70,7 @@ class SessionDBAuth(BaseAuth):
 
         employee = get_obj(Employee, employee_id)
         if employee:
+            g.current_employee = employee
             return employee
 
     def destroy_session(self) -> bool | None:
@@ -89,11 +99,21 @@ class SessionDBAuth(BaseAuth):
     ) -> str | None:
         """
         Return employee ID for a valid session ID.
+
+        The session row is read on every request rather than cached per
+        process, so a logout in one worker is seen by all of them at
+        once. Loading the employee in the same query keeps this to one
+        round trip: `current_employee` then finds it in the identity
+        map instead of selecting it again.
         """
         if not session_id or not isinstance(session_id, str):  # type: ignore
             return
 
-        session = get_obj(EmployeeSession, session_id)
+        session = get_obj(
+            EmployeeSession,
+            session_id,
+            options=[joinedload(EmployeeSession.employee)],
+        )
         if not session:
             return
 
@@ -107,6 +127,7 @@ class SessionDBAuth(BaseAuth):
             except Exception as e:
                 logger.error(f"Failed to delete expired session: {e}")
             return
+
         return session.employee_id
 
     def get_session(self, employee: Employee) -> str | None:
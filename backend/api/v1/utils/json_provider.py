@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+orjson-backed JSON provider for the Flask application.
+"""
+
+from decimal import Decimal
+from flask import Response, stream_with_context
+from flask.json.provider import JSONProvider
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+import orjson
+
+from models.basemodel import BaseModel
+
+
+T = TypeVar("T")
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Serialize types orjson does not support natively.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.to_dict()
+    if isinstance(obj, (Decimal, Exception)):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson.
+
+    Used by `jsonify`, `request.get_json` and the test client. Output
+    is always compact and keeps insertion order; keys are never sorted,
+    in debug mode too.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string.
+        """
+        return orjson.dumps(
+            obj, default=orjson_default, option=ORJSON_OPTIONS
+        ).decode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Build a JSON response from orjson's bytes, skipping the str
+        round trip of `dumps`.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS),
+            mimetype="application/json",
+        )
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize data from a JSON string or bytes.
+        """
+        return orjson.loads(s)
+
+
+def json_response(data: Any) -> Response:
+    """
+    Build a JSON response straight from orjson's bytes.
+
+    Skips `jsonify`'s argument handling and the str round trip of
+    `OrjsonProvider.dumps`, for the hottest single-object GETs.
+    """
+    return Response(
+        orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS),
+        mimetype="application/json",
+    )
+
+
+def stream_json_list(
+    objects: Iterable[T],
+    to_dict: Callable[[T], dict[str, Any]],
+    on_complete: Callable[[bytes], None] | None = None,
+) -> Response:
+    """
+    Stream objects as a JSON array, serializing one item at a time.
+
+    The generator runs after the request's database session has been
+    removed, so everything `to_dict` reads must already be loaded,
+    e.g. with `selectinload` on the query.
+
+    If `on_complete` is given, it receives the whole body once the last
+    chunk has been sent, e.g. to cache it.
+    """
+
+    def generate() -> Iterator[bytes]:
+        chunks: list[bytes] = []
+        separator = b"["
+        for obj in objects:
+            chunk = separator + orjson.dumps(
+                to_dict(obj), default=orjson_default, option=ORJSON_OPTIONS
+            )
+            if on_complete:
+                chunks.append(chunk)
+            yield chunk
+            separator = b","
+        chunk = b"[]" if separator == b"[" else b"]"
+        yield chunk
+        if on_complete:
+            chunks.append(chunk)
+            on_complete(b"".join(chunks))
+
+    return Response(
+        stream_with_context(generate()), mimetype="application/json"
+    )
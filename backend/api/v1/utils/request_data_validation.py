@@ -7,11 +7,14 @@ utilities for request data.
 
 from enum import Enum
 from flask import abort, request
-from json import JSONDecodeError
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    BeforeValidator,
+    ConfigDict,
     ValidationError,
     EmailStr,
+    Field,
     StringConstraints,
     StrictBool,
     PositiveFloat,
@@ -20,11 +23,54 @@ from pydantic import (
 )
 from typing import Any, Annotated, Type, TypeVar, Optional
 import logging
+import re
 
 
 T = TypeVar("T", bound=BaseModel)
+BULK_ITEMS_MAX = 500
 logger = logging.getLogger(__name__)
 
+UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+DIGIT_PATTERN = re.compile(r"\d")
+
+NameStr = Annotated[
+    str,
+    StringConstraints(
+        min_length=3,
+        max_length=200,
+        to_lower=True,
+        strip_whitespace=True
+    ),
+]
+AddressStr = Annotated[
+    str,
+    StringConstraints(
+        min_length=10,
+        max_length=500,
+        to_lower=True,
+        strip_whitespace=True
+    ),
+]
+DescriptionStr = Annotated[
+    str,
+    StringConstraints(
+        min_length=3,
+        max_length=2000,
+        to_lower=True,
+        strip_whitespace=True
+    ),
+]
+LowerEmailStr = Annotated[EmailStr, AfterValidator(str.lower)]
+IdStr = Annotated[
+    str,
+    StringConstraints(
+        min_length=36,
+        max_length=36,
+        to_lower=True,
+        strip_whitespace=True
+    ),
+]
+
 
 class EmployeeRole(str, Enum):
     """
@@ -71,13 +117,14 @@ class EmployeeLogin(BaseModel):
     Schema for employee login validation.
     """
 
-    email: Optional[EmailStr] = None
+    email: Optional[LowerEmailStr] = None
     username: Optional[
         Annotated[
             str,
             StringConstraints(
                 min_length=3,
                 max_length=100,
+                to_lower=True,
                 strip_whitespace=True
             )
         ]
@@ -91,23 +138,15 @@ class EmployeeLogin(BaseModel):
         )
     ]
 
-    @field_validator("email", "username")
-    @classmethod
-    def lowercase_email_username(cls, v: str) -> str:
-        """
-        Convert email/username to lowercase.
-        """
-        return v.lower()
-
     @field_validator("password")
     @classmethod
     def check_complexity(cls, v: str):
         """
         Ensure password contains uppercase and digit.
         """
-        if not any(c.isupper() for c in v):
+        if not UPPERCASE_PATTERN.search(v):
             raise ValueError("Must contain an uppercase")
-        if not any(c.isdigit() for c in v):
+        if not DIGIT_PATTERN.search(v):
             raise ValueError("Must contain a digit")
         return v
 
@@ -117,45 +156,13 @@ class EmployeeRegister(BaseModel):
     Schema for employee registration validation.
     """
 
-    first_name: Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=200,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
-    middle_name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
-    last_name: Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=200,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
-    username: Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=200,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
-    email: EmailStr
+    model_config = ConfigDict(use_enum_values=True)
+
+    first_name: NameStr
+    middle_name: Optional[NameStr] = None
+    last_name: NameStr
+    username: NameStr
+    email: LowerEmailStr
     password: Annotated[
         str,
         StringConstraints(
@@ -164,35 +171,19 @@ class EmployeeRegister(BaseModel):
             strip_whitespace=True
         )
     ]
-    home_address: Annotated[
-        str,
-        StringConstraints(
-            min_length=10,
-            max_length=500,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
-    role: EmployeeRole
+    home_address: AddressStr
+    role: Annotated[EmployeeRole, BeforeValidator(str.lower)]
     is_admin: Optional[StrictBool] = None
 
-    @field_validator("email", "role", mode="before")
-    @classmethod
-    def lowercase_email_username(cls, v: str) -> str:
-        """
-        Convert email and role to lowercase.
-        """
-        return v.lower()
-
     @field_validator("password")
     @classmethod
     def check_complexity(cls, v: str):
         """
         Ensure password contains uppercase and digit.
         """
-        if not any(c.isupper() for c in v):
+        if not UPPERCASE_PATTERN.search(v):
             raise ValueError("Must contain an uppercase")
-        if not any(c.isdigit() for c in v):
+        if not DIGIT_PATTERN.search(v):
             raise ValueError("Must contain a digit")
         return v
 
@@ -202,50 +193,12 @@ class EmployeeUpdate(BaseModel):
     Schema for updating employee details.
     """
 
-    first_name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
-    middle_name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
-    last_name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
-    home_address: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=10,
-                max_length=500,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    model_config = ConfigDict(use_enum_values=True)
+
+    first_name: Optional[NameStr] = None
+    middle_name: Optional[NameStr] = None
+    last_name: Optional[NameStr] = None
+    home_address: Optional[AddressStr] = None
     role: Optional[EmployeeRole] = None
     is_admin: Optional[StrictBool] = None
 
@@ -255,15 +208,7 @@ class BrandRegister(BaseModel):
     Schema for brand creation.
     """
 
-    name: Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=200,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
+    name: NameStr
     is_active: Optional[StrictBool] = True
 
 
@@ -272,17 +217,7 @@ class BrandUpdate(BaseModel):
     Schema for updating brand details.
     """
 
-    name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    name: Optional[NameStr] = None
     is_active: Optional[StrictBool] = True
 
 
@@ -291,24 +226,8 @@ class CategoryRegister(BaseModel):
     Schema for category creation.
     """
 
-    name: Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=200,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
-    description: Optional[Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=2000,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]] = None
+    name: NameStr
+    description: Optional[DescriptionStr] = None
 
 
 class CategoryUpdate(BaseModel):
@@ -316,28 +235,8 @@ class CategoryUpdate(BaseModel):
     Schema for updating category details.
     """
 
-    name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
-    description: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=2000,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    name: Optional[NameStr] = None
+    description: Optional[DescriptionStr] = None
 
 
 class ProductRegister(BaseModel):
@@ -345,25 +244,9 @@ class ProductRegister(BaseModel):
     Schema for product creation.
     """
 
-    name: Annotated[
-        str,
-        StringConstraints(
-            min_length=3,
-            max_length=200,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
+    name: NameStr
     selling_price: Annotated[float, PositiveFloat]
-    category_id: Optional[Annotated[
-        str,
-        StringConstraints(
-            min_length=36,
-            max_length=36,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]] = None
+    category_id: Optional[IdStr] = None
 
 
 class ProductUpdate(BaseModel):
@@ -371,29 +254,9 @@ class ProductUpdate(BaseModel):
     Schema for updating product details.
     """
 
-    name: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=3,
-                max_length=200,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    name: Optional[NameStr] = None
     selling_price: Optional[Annotated[float, PositiveFloat]] = None
-    category_id: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=36,
-                max_length=36,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    category_id: Optional[IdStr] = None
 
 
 class PurchaseOrderRegister(BaseModel):
@@ -402,15 +265,7 @@ class PurchaseOrderRegister(BaseModel):
     """
 
     status: Optional[OrderStatus] = OrderStatus.pending
-    brand_id: Annotated[
-        str,
-        StringConstraints(
-            min_length=36,
-            max_length=36,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
+    brand_id: IdStr
 
 
 class PurchaseOrderUpdate(BaseModel):
@@ -419,17 +274,7 @@ class PurchaseOrderUpdate(BaseModel):
     """
 
     status: Optional[OrderStatus] = OrderStatus.pending
-    brand_id: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=36,
-                max_length=36,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    brand_id: Optional[IdStr] = None
 
 
 class PurchaseOrderItemRegister(BaseModel):
@@ -437,15 +282,7 @@ class PurchaseOrderItemRegister(BaseModel):
     Schema for adding items to a purchase order.
     """
 
-    product_id: Annotated[
-        str,
-        StringConstraints(
-            min_length=36,
-            max_length=36,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
+    product_id: IdStr
     quantity: Annotated[int, PositiveInt]
     unit_cost_price: Annotated[float, PositiveFloat]
     total_cost_price: Annotated[float, PositiveFloat]
@@ -453,22 +290,23 @@ class PurchaseOrderItemRegister(BaseModel):
     item_status: Optional[ItemStatus] = ItemStatus.pending
 
 
+class PurchaseOrderItemsRegister(BaseModel):
+    """
+    Schema for adding several items to a purchase order at once.
+    """
+
+    items: Annotated[
+        list[PurchaseOrderItemRegister],
+        Field(min_length=1, max_length=BULK_ITEMS_MAX),
+    ]
+
+
 class PurchaseOrderItemUpdate(BaseModel):
     """
     Schema for updating purchase order items.
     """
 
-    product_id: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=36,
-                max_length=36,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    product_id: Optional[IdStr] = None
     quantity: Optional[Annotated[int, PositiveInt]] = None
     unit_cost_price: Optional[Annotated[float, PositiveFloat]] = None
     total_cost_price: Optional[Annotated[float, PositiveFloat]] = None
@@ -481,24 +319,8 @@ class SaleRegister(BaseModel):
     Schema for sales creation.
     """
 
-    product_id: Annotated[
-        str,
-        StringConstraints(
-            min_length=36,
-            max_length=36,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
-    brand_id: Annotated[
-        str,
-        StringConstraints(
-            min_length=36,
-            max_length=36,
-            to_lower=True,
-            strip_whitespace=True
-        ),
-    ]
+    product_id: IdStr
+    brand_id: IdStr
     quantity: Annotated[int, PositiveInt]
     unit_selling_price: Annotated[float, PositiveFloat]
     total_selling_price: Annotated[float, PositiveFloat]
@@ -509,59 +331,60 @@ class SaleUpdate(BaseModel):
     Schema for updating sales records.
     """
 
-    product_id: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=36,
-                max_length=36,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
-    brand_id: Optional[
-        Annotated[
-            str,
-            StringConstraints(
-                min_length=36,
-                max_length=36,
-                to_lower=True,
-                strip_whitespace=True
-            ),
-        ]
-    ] = None
+    product_id: Optional[IdStr] = None
+    brand_id: Optional[IdStr] = None
     quantity: Optional[Annotated[int, PositiveInt]] = None
     unit_selling_price: Optional[Annotated[float, PositiveFloat]] = None
     total_selling_price: Optional[Annotated[float, PositiveFloat]] = None
 
 
-def get_request_data() -> dict[str, Any]:
+def get_expand_fields() -> frozenset[str]:
     """
-    Extract and validate JSON from the request.
+    Return the relations requested with the `expand` query parameter,
+    e.g. `?expand=products`.
     """
-    try:
-        request_data: dict[str, Any] = request.get_json()
-    except JSONDecodeError:
-        abort(400, description="Not a json")
+    expand = request.args.get("expand", "")
+    return frozenset(
+        field.strip().lower() for field in expand.split(",") if field.strip()
+    )
 
-    return request_data
+
+def is_not_json_object(error: ValidationError) -> bool:
+    """
+    Return True if validation failed because the body is not a JSON
+    object, rather than because of a field.
+    """
+    return any(
+        err["type"] == "json_invalid"
+        or (err["type"] == "model_type" and not err["loc"])
+        for err in error.errors()
+    )
 
 
 def validate_request_data(validation_cls: Type[T]) -> dict[str, Any]:
     """
     Validate incoming request data against a Pydantic model.
+
+    The raw body is parsed and validated in one pass by pydantic's
+    JSON validator, without building an intermediate Python dict.
     """
-    request_data = get_request_data()
+    if not request.is_json:
+        abort(400, description="Not a json")
 
-    if not issubclass(validation_cls, BaseModel):  # type: ignore
-        abort(500, description="Validation class must inherit from BaseModel")
+    if __debug__:
+        if not issubclass(validation_cls, BaseModel):  # type: ignore
+            abort(
+                500,
+                description="Validation class must inherit from BaseModel"
+            )
 
     try:
-        valid_data = validation_cls(**request_data)
+        valid_data = validation_cls.model_validate_json(request.get_data())
     except ValidationError as e:
+        if is_not_json_object(e):
+            abort(400, description="Not a json")
         abort(400, description=e.errors())
 
-    if not valid_data.model_dump(exclude=None):
+    if not valid_data.model_fields_set:
         abort(400, description="Request data cannot be empty")
     return valid_data.model_dump(exclude_unset=True)
@@ -4,76 +4,313 @@
 Utility functions and database helpers.
 """
 
-from flask import abort
+from cachetools import TTLCache
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+from flask import Response, abort, request
 from psycopg2.errors import UniqueViolation
 from sqlalchemy.exc import IntegrityError
-from typing import Type, TypeVar, Any
+from sqlalchemy.sql.base import ExecutableOption
+from typing import Any, Callable, NoReturn, Sequence, Type, TypeVar
+from uuid import UUID
 import logging
+import threading
 
+from api.v1.utils.json_provider import stream_json_list
 from models import storage
 from models.basemodel import BaseModel
 from models.employee import Employee
+from models.engine.dbstorage import is_valid_id
 
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
+OBJ_CACHE_TTL = 30
+OBJ_CACHE_SIZE = 10_000
+
+_obj_dict_cache: TTLCache[tuple[type, str], dict[str, Any]] = TTLCache(
+    maxsize=OBJ_CACHE_SIZE, ttl=OBJ_CACHE_TTL
+)
+_obj_dict_cache_lock = threading.Lock()
+
+LIST_CACHE_TTL = 5
+LIST_CACHE_SIZE = 256
+
+_list_cache: TTLCache[tuple[Any, ...], tuple[bytes, dict[str, str]]] = (
+    TTLCache(maxsize=LIST_CACHE_SIZE, ttl=LIST_CACHE_TTL)
+)
+_list_cache_lock = threading.Lock()
+
+PAGE_CURSOR_HEADER = "X-Next-Page-After"
+
 
 def check_email_username_exists(data: dict[str, Any]) -> None:
     """
+    Abort with 409 if the email or username is already taken.
     """
-    if "email" in data:
-        employee = Employee.search_employee_by_email_username(
-            data["email"]
-        )
-        if employee:
-            abort(409, description="Email already exist.")
+    email = data.get("email")
+    username = data.get("username")
+    if not email and not username:
+        return
 
-    if "username" in data:
-        employee = Employee.search_employee_by_email_username(
-            data["username"]
-        )
-        if employee:
-            abort(409, description="Username already exists.")
+    employees = Employee.search_by_email_or_username(email, username)
+    if email and any(employee.email == email for employee in employees):
+        abort(409, description="Email already exist.")
+    if username and any(
+        employee.username == username for employee in employees
+    ):
+        abort(409, description="Username already exists.")
 
 
-def get_obj(cls: Type[T], id: str) -> T | None:
-    """
-    Fetch a record by ID.
+def get_obj(
+    cls: Type[T], id: str, options: Sequence[ExecutableOption] = ()
+) -> T | None:
     """
+    Fetch a record by ID, applying any loader `options`.
 
-    if not issubclass(cls, BaseModel):  # type: ignore
-        abort(400, description="Invalid class")
-    if not isinstance(id, str):  # type: ignore
-        abort(400, description="id must be a valid string.")
+    The argument checks guard against programming errors only and are
+    skipped when Python runs with optimizations (-O).
+    """
+    if __debug__:
+        if not issubclass(cls, BaseModel):  # type: ignore
+            abort(400, description="Invalid class")
+        if not isinstance(id, str):  # type: ignore
+            abort(400, description="id must be a valid string.")
 
-    obj = storage.get_obj_by_id(cls, id)
+    obj = storage.get_obj_by_id(cls, id, options)
     return obj
 
 
+def obj_cache_key(cls: Type[BaseModel], id: str) -> tuple[type, str] | None:
+    """
+    Return the cache key for a record ID, or None if it is not one.
+
+    Postgres matches a uuid however it is written (upper case, braces,
+    no hyphens), so the key uses the canonical form; otherwise an entry
+    cached under one spelling would outlive `uncache_obj` under another.
+    """
+    if not is_valid_id(id):
+        return None
+    return cls, str(UUID(id))
+
+
+def get_obj_dict(
+    cls: Type[T], id: str, to_dict: Callable[[T], dict[str, Any]]
+) -> dict[str, Any] | None:
+    """
+    Fetch a record by ID as a dictionary, cached per worker.
+
+    Entries live for OBJ_CACHE_TTL seconds and must be dropped with
+    `uncache_obj` when the record is updated or deleted. Changes to
+    related rows (e.g. a renamed category) show up once the entry
+    expires.
+
+    `uncache_obj` only reaches this worker's cache, so other workers
+    can serve the old record for up to OBJ_CACHE_TTL seconds. That is
+    acceptable for catalogue reads: writes always go to the database,
+    and the worst case is a briefly outdated name or price. Sessions
+    are not cached this way, because a stale session would keep
+    accepting a cookie after logout.
+    """
+    key = obj_cache_key(cls, id)
+    if key is None:
+        return None
+    with _obj_dict_cache_lock:
+        obj_dict = _obj_dict_cache.get(key)
+    if obj_dict is not None:
+        return obj_dict
+
+    obj = get_obj(cls, key[1])
+    if not obj:
+        return None
+
+    obj_dict = to_dict(obj)
+    with _obj_dict_cache_lock:
+        _obj_dict_cache[key] = obj_dict
+    return obj_dict
+
+
+def uncache_obj(cls: Type[BaseModel], id: str) -> None:
+    """
+    Drop a record's cached dictionary.
+    """
+    key = obj_cache_key(cls, id)
+    if key is None:
+        return
+    with _obj_dict_cache_lock:
+        _obj_dict_cache.pop(key, None)
+
+
+def get_page_cursor() -> tuple[datetime, str] | None:
+    """
+    Return the (created_at, id) in the `after` query argument, if any.
+
+    The value is the PAGE_CURSOR_HEADER of the previous page; abort with
+    400 if it is not one.
+    """
+    cursor = request.args.get("after")
+    if cursor is None:
+        return None
+
+    created_at, _, id = cursor.partition(",")
+    try:
+        after = (datetime.fromisoformat(created_at), id)
+    except ValueError:
+        after = None
+    if not after or not is_valid_id(id):
+        abort(400, description="Invalid page cursor")
+    return after
+
+
+def page_cursor_headers(
+    objects: Sequence[BaseModel], page_size: int
+) -> dict[str, str]:
+    """
+    Return the header pointing at the page after `objects`.
+
+    A short page is the last one and gets no cursor.
+    """
+    if len(objects) < page_size:
+        return {}
+    last = objects[-1]
+    return {PAGE_CURSOR_HEADER: f"{last.created_at.isoformat()},{last.id}"}
+
+
+def paginated_response(
+    cls: Type[T],
+    page_size: int,
+    page_num: int,
+    to_dict: Callable[[T], dict[str, Any]],
+    options: Sequence[ExecutableOption] = (),
+    not_found: str = "No record found",
+    cache: bool = True,
+) -> Response:
+    """
+    Return a page of records as a streamed JSON array.
+
+    The page starts after the `after` cursor when the request has one,
+    and its PAGE_CURSOR_HEADER is the cursor for the next page.
+
+    Each worker keeps the encoded body for LIST_CACHE_TTL seconds. The
+    key includes the model's write generation, so a commit to the
+    model's table in this worker invalidates its pages at once; edits
+    to related rows or in other workers show up once the entry expires.
+    With `cache=False` every request reads the page from the database.
+    """
+    after = get_page_cursor()
+    key = (cls, page_size, page_num, after, storage.generation(cls))
+    if cache:
+        with _list_cache_lock:
+            cached = _list_cache.get(key)
+        if cached is not None:
+            body, headers = cached
+            return Response(
+                body, mimetype="application/json", headers=headers
+            )
+
+    objects = storage.all(
+        cls, page_size, page_num, options=options, after=after
+    )
+    if not objects:
+        abort(404, description=not_found)
+    headers = page_cursor_headers(objects, page_size)
+
+    def cache_body(body: bytes) -> None:
+        with _list_cache_lock:
+            _list_cache[key] = (body, headers)
+
+    response = stream_json_list(
+        objects, to_dict, on_complete=cache_body if cache else None
+    )
+    response.headers.update(headers)
+    return response
+
+
+def run_bcrypt(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a bcrypt hash or check on the shared bcrypt thread pool.
+    """
+    from api.v1.app import bcrypt_pool, BCRYPT_TIMEOUT
+
+    future = bcrypt_pool.submit(func, *args)
+    try:
+        return future.result(timeout=BCRYPT_TIMEOUT)
+    except FutureTimeoutError:
+        logger.error("Bcrypt operation timed out")
+        abort(500)
+
+
+def abort_for_db_error(e: Exception) -> NoReturn:
+    """
+    Abort with 409 for unique violations and 500 for other failures.
+    """
+    if isinstance(e, IntegrityError) and isinstance(e.orig, UniqueViolation):
+        detail = e.orig.diag.message_detail
+        abort(409, description=detail)
+    logger.error(f"Database operation failed: {e}")
+    abort(500)
+
+
 class DatabaseOp:
     """
-    imple wrapper for database operations.
+    Simple wrapper for database operations.
+
+    All calls act on the request's scoped session, so a view stages
+    its changes and commits them once with `save` or `commit`.
     """
 
-    def save(self, obj: BaseModel):
+    @staticmethod
+    def save(obj: BaseModel):
         """
         Save object to database.
         """
         try:
             obj.save()
-        except IntegrityError as e:
-            if isinstance(e.orig, UniqueViolation):
-                detail = e.orig.diag.message_detail
-                abort(409, description=detail)
-            else:
-                logger.error(f"Database operation failed: {e}")
-                abort(500)
         except Exception as e:
-            logger.error(f"Database operation failed: {e}")
-            abort(500)
+            abort_for_db_error(e)
+
+    @staticmethod
+    def save_many(objs: Sequence[BaseModel]):
+        """
+        Save several new objects with a single commit.
 
-    def commit(self):
+        The flush sends the rows of each table as one batched INSERT
+        rather than a statement per object.
+        """
+        try:
+            storage.new_all(objs)
+            storage.save()
+        except Exception as e:
+            abort_for_db_error(e)
+
+    @staticmethod
+    def update(obj: BaseModel, data: dict[str, Any]):
+        """
+        Apply validated fields to an object and save it.
+        """
+        for attr, value in data.items():
+            setattr(obj, attr, value)
+        DatabaseOp.save(obj)
+
+    @staticmethod
+    def update_by_id(
+        cls: Type[T], id: str, data: dict[str, Any]
+    ) -> T | None:
+        """
+        Update a record's columns without loading it first and commit.
+
+        Returns the updated object, or None if no record has that ID.
+        """
+        try:
+            obj = storage.update_by_id(cls, id, data)
+            storage.save()
+        except Exception as e:
+            abort_for_db_error(e)
+        return obj
+
+    @staticmethod
+    def commit():
         """
         Commit all changes.
         """
@@ -83,7 +320,8 @@ class DatabaseOp:
             logger.error(f"Database operation failed: {e}")
             abort(500)
 
-    def delete(self, obj: BaseModel):
+    @staticmethod
+    def delete(obj: BaseModel):
         """
         Delete object from database.
         """
@@ -92,3 +330,18 @@ class DatabaseOp:
         except Exception as e:
             logger.error(f"{e}")
             abort(400, description="Database operation failed.")
+
+    @staticmethod
+    def delete_by_id(cls: Type[BaseModel], id: str) -> bool:
+        """
+        Delete a record by ID without loading it and commit.
+
+        Returns False if no record has that ID.
+        """
+        try:
+            deleted = storage.delete_by_id(cls, id)
+            storage.save()
+        except Exception as e:
+            logger.error(f"{e}")
+            abort(400, description="Database operation failed.")
+        return deleted > 0
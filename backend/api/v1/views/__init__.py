@@ -6,7 +6,11 @@ Registers all API v1 blueprints and routes.
 
 from flask import Blueprint
 
+from api.v1.auth.authorization import check_authentication
+
 app_views = Blueprint("app_views", __name__, url_prefix="/api/v1")
+public_views = Blueprint("public_views", __name__, url_prefix="/api/v1")
+app_views.before_request(check_authentication)
 
 from api.v1.views.brands import *
 from api.v1.views.categories import *
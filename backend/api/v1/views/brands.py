@@ -5,6 +5,7 @@ Defines routes for brand management operations.
 """
 
 from flask import abort, jsonify, g
+from sqlalchemy.orm import selectinload
 from typing import Any
 import logging
 
@@ -13,11 +14,19 @@ from api.v1.views import app_views
 from api.v1.utils.request_data_validation import (
     BrandRegister,
     BrandUpdate,
+    get_expand_fields,
     validate_request_data,
 )
-from api.v1.utils.utility import DatabaseOp, get_obj
+from api.v1.utils.json_provider import json_response
+from api.v1.utils.utility import (
+    DatabaseOp,
+    get_obj_dict,
+    paginated_response,
+    uncache_obj,
+)
 from models import storage
 from models.brand import Brand
+from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
@@ -44,8 +53,7 @@ def register_brand():
 
     brand = Brand(**valid_data)
     brand.added_by = admin
-    db = DatabaseOp()
-    db.save(brand)
+    DatabaseOp.save(brand)
 
     brand_dict = get_brand_dict(brand)
     return jsonify(brand_dict), 201
@@ -61,15 +69,17 @@ def get_all_brands(page_size: int, page_num: int):
     """
     Retrieves all brands with pagination.
     """
-    brands_objects = storage.all(Brand, page_size, page_num)
-    if not brands_objects:
-        abort(404, description="No brand found")
-
-    brand_lists: list[dict[str, Any]] = []
-    for brand in brands_objects:
-        brand_dict = get_brand_dict(brand)
-        brand_lists.append(brand_dict)
-    return jsonify(brand_lists), 200
+    return paginated_response(
+        Brand,
+        page_size,
+        page_num,
+        get_brand_dict,
+        options=[
+            selectinload(Brand.added_by).load_only(Employee.username),
+        ],
+        not_found="No brand found",
+        cache=False,
+    ), 200
 
 
 @app_views.route(
@@ -81,13 +91,20 @@ def get_all_brands(page_size: int, page_num: int):
 def get_brand(brand_id: str):
     """
     Retrieves a single brand by ID.
+
+    `?expand=products` also returns the names of the linked products.
     """
-    brand = get_obj(Brand, brand_id)
-    if not brand:
+    brand_dict = get_obj_dict(Brand, brand_id, get_brand_dict)
+    if not brand_dict:
         abort(404, description="Brand does not exist")
 
-    brand_dict = get_brand_dict(brand)
-    return jsonify(brand_dict), 200
+    if "products" in get_expand_fields():
+        # Copy, so the cached dict stays unexpanded.
+        brand_dict = {
+            **brand_dict,
+            "products": list(storage.get_product_names_for_brand(brand_id)),
+        }
+    return json_response(brand_dict), 200
 
 
 @app_views.route(
@@ -101,15 +118,10 @@ def update_brand(brand_id: str):
     Updates brand details.
     """
     valid_data = validate_request_data(BrandUpdate)
-    brand = get_obj(Brand, brand_id)
+    brand = DatabaseOp.update_by_id(Brand, brand_id, valid_data)
     if not brand:
         abort(404, description="Brand does not exist")
-
-    for attr, value in valid_data.items():
-        setattr(brand, attr, value)
-
-    db = DatabaseOp()
-    db.save(brand)
+    uncache_obj(Brand, brand_id)
 
     brand_dict = get_brand_dict(brand)
     return jsonify(brand_dict), 200
@@ -125,11 +137,8 @@ def delete_brand(brand_id: str):
     """
     Deletes a brand by ID.
     """
-    brand = get_obj(Brand, brand_id)
-    if not brand:
+    if not DatabaseOp.delete_by_id(Brand, brand_id):
         abort(404, description="Brand does not exist")
 
-    db = DatabaseOp()
-    db.delete(brand)
-    db.commit()
+    uncache_obj(Brand, brand_id)
     return jsonify({}), 200
@@ -5,6 +5,7 @@ Defines routes for category management operations.
 """
 
 from flask import abort, jsonify, g
+from sqlalchemy.orm import selectinload
 from typing import Any
 import logging
 
@@ -15,9 +16,15 @@ from api.v1.utils.request_data_validation import (
     CategoryUpdate,
     validate_request_data,
 )
-from api.v1.utils.utility import DatabaseOp, get_obj
-from models import storage
+from api.v1.utils.json_provider import json_response
+from api.v1.utils.utility import (
+    DatabaseOp,
+    get_obj_dict,
+    paginated_response,
+    uncache_obj,
+)
 from models.category import Category
+from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
@@ -51,8 +58,7 @@ def register_category():
 
     category = Category(**valid_data)
     category.added_by = admin
-    db = DatabaseOp()
-    db.save(category)
+    DatabaseOp.save(category)
 
     category_dict = get_category_dict(category)
     return jsonify(category_dict), 201
@@ -68,15 +74,17 @@ def get_all_categories(page_size: int, page_num: int):
     """
     Retrieves all categories with pagination.
     """
-    categories_objects = storage.all(Category, page_size, page_num)
-    if not categories_objects:
-        abort(404, description="No category found")
-
-    category_lists: list[dict[str, Any]] = []
-    for category in categories_objects:
-        category_dict = get_category_dict(category)
-        category_lists.append(category_dict)
-    return jsonify(category_lists), 200
+    return paginated_response(
+        Category,
+        page_size,
+        page_num,
+        get_category_dict,
+        options=[
+            selectinload(Category.added_by).load_only(Employee.username),
+        ],
+        not_found="No category found",
+        cache=False,
+    ), 200
 
 
 @app_views.route(
@@ -89,12 +97,11 @@ def get_category(category_id: str):
     """
     Retrieves a single category by ID.
     """
-    category = get_obj(Category, category_id)
-    if not category:
+    category_dict = get_obj_dict(Category, category_id, get_category_dict)
+    if not category_dict:
         abort(404, description="Category does not exist")
 
-    category_dict = get_category_dict(category)
-    return jsonify(category_dict), 200
+    return json_response(category_dict), 200
 
 
 @app_views.route(
@@ -108,15 +115,10 @@ def update_category(category_id: str):
     Updates a category’s details.
     """
     valid_data = validate_request_data(CategoryUpdate)
-    category = get_obj(Category, category_id)
+    category = DatabaseOp.update_by_id(Category, category_id, valid_data)
     if not category:
         abort(404, description="Category does not exist")
-
-    for attr, value in valid_data.items():
-        setattr(category, attr, value)
-
-    db = DatabaseOp()
-    db.save(category)
+    uncache_obj(Category, category_id)
 
     category_dict = get_category_dict(category)
     return jsonify(category_dict), 200
@@ -132,11 +134,8 @@ def delete_category(category_id: str):
     """
     Deletes a category by ID.
     """
-    category = get_obj(Category, category_id)
-    if not category:
+    if not DatabaseOp.delete_by_id(Category, category_id):
         abort(404, description="Category does not exist")
 
-    db = DatabaseOp()
-    db.delete(category)
-    db.commit()
+    uncache_obj(Category, category_id)
     return jsonify({}), 200
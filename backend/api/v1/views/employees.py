@@ -8,23 +8,26 @@ from flask import abort, jsonify
 import logging
 
 from api.v1.auth.authorization import admin_only
-from api.v1.views import app_views
+from api.v1.views import app_views, public_views
 from api.v1.utils.request_data_validation import (
     EmployeeRegister,
     EmployeeUpdate,
     validate_request_data,
 )
 from api.v1.utils.utility import (
-    DatabaseOp, get_obj, check_email_username_exists
+    DatabaseOp,
+    get_obj,
+    check_email_username_exists,
+    paginated_response,
+    run_bcrypt,
 )
-from models import storage
 from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
 
 
-@app_views.route("/register", strict_slashes=False, methods=["POST"])
+@public_views.route("/register", strict_slashes=False, methods=["POST"])
 def register_employee():
     """
     Registers a new employee.
@@ -34,13 +37,13 @@ def register_employee():
 
     check_email_username_exists(valid_data)
 
-    valid_data["password"] = bcrypt.generate_password_hash(  # type: ignore
-        valid_data["password"]
+    valid_data["password"] = run_bcrypt(
+        bcrypt.generate_password_hash,  # type: ignore
+        valid_data["password"],
     ).decode("utf-8")
     employee = Employee(**valid_data)
 
-    db = DatabaseOp()
-    db.save(employee)
+    DatabaseOp.save(employee)
 
     employee_dict = employee.to_dict()
     return jsonify(employee_dict), 201
@@ -56,14 +59,14 @@ def get_all_employees(page_size: int, page_num: int):
     """
     Retrieves all employees with pagination.
     """
-    employees_objects = storage.all(Employee, page_size, page_num)
-    if not employees_objects:
-        abort(404, description="No employee found")
-
-    all_employees = [
-        employee.to_dict() for employee in employees_objects
-    ]
-    return jsonify(all_employees), 200
+    return paginated_response(
+        Employee,
+        page_size,
+        page_num,
+        Employee.to_dict,
+        not_found="No employee found",
+        cache=False,
+    ), 200
 
 
 @app_views.route(
@@ -97,11 +100,7 @@ def update_employee(employee_id: str):
     if not employee:
         abort(404, description="User does not exist")
 
-    for attr, value in valid_data.items():
-        setattr(employee, attr, value)
-
-    db = DatabaseOp()
-    db.save(employee)
+    DatabaseOp.update(employee, valid_data)
 
     employee_dict = employee.to_dict()
     return jsonify(employee_dict), 200
@@ -121,7 +120,6 @@ def delete_employee(employee_id: str):
     if not employee:
         abort(404, description="User does not exist")
 
-    db = DatabaseOp()
-    db.delete(employee)
-    db.commit()
+    DatabaseOp.delete(employee)
+    DatabaseOp.commit()
     return jsonify({}), 200
@@ -5,39 +5,38 @@ Brand routes for managing product-brand relationships.
 """
 
 from flask import abort, jsonify
-from typing import Any
+from typing import Any, Sequence
 
 from api.v1.auth.authorization import admin_only
 from api.v1.views import app_views
 from api.v1.utils.utility import get_obj
+from models import storage
 from models.product import Product
 from models.brand import Brand
 
 
-def all_brand_products(brand: Brand) -> dict[str, Any]:
+def all_brand_products(
+    brand: Brand, product_names: Sequence[str]
+) -> dict[str, Any]:
     """
     Return brand data excluding relations.
     """
-    product_list: list[str] = [
-        product.name for product in brand.products
-    ]
     brand_products: dict[str, Any] = {
         "brand_name": brand.name,
-        "products": product_list
+        "products": list(product_names)
     }
     return brand_products
 
 
-def all_product_brands(product: Product) -> dict[str, Any]:
+def all_product_brands(
+    product: Product, brand_names: Sequence[str]
+) -> dict[str, Any]:
     """
     Return brand data excluding relations.
     """
-    brand_list: list[str] = [
-        brand.name for brand in product.brands
-    ]
     product_brands: dict[str, Any] = {
         "product_name": product.name,
-        "brands": brand_list
+        "brands": list(brand_names)
     }
     return product_brands
 
@@ -63,7 +62,9 @@ def add_product_brands(product_id: str, brand_id: str):
     product.brands.append(brand)
     product.save()
 
-    product_brands = all_product_brands(product)
+    product_brands = all_product_brands(
+        product, [brand.name for brand in product.brands]
+    )
     return jsonify(product_brands), 201
 
 
@@ -81,7 +82,9 @@ def get_product_brands(product_id: str):
     if not product:
         abort(404, description="Product does not exist")
 
-    product_brands = all_product_brands(product)
+    product_brands = all_product_brands(
+        product, storage.get_brand_names_for_product(product.id)
+    )
     return jsonify(product_brands), 200
 
 
@@ -99,7 +102,9 @@ def get_brand_products(brand_id: str):
     if not brand:
         abort(404, description="Brand does not exist")
 
-    brand_products = all_brand_products(brand)
+    brand_products = all_brand_products(
+        brand, storage.get_product_names_for_brand(brand.id)
+    )
     return jsonify(brand_products), 200
 
 
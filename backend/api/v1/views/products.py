@@ -5,6 +5,7 @@ Routes for managing products.
 """
 
 from flask import abort, jsonify, g
+from sqlalchemy.orm import selectinload
 from typing import Any
 import logging
 
@@ -13,12 +14,21 @@ from api.v1.views import app_views
 from api.v1.utils.request_data_validation import (
     ProductRegister,
     ProductUpdate,
+    get_expand_fields,
     validate_request_data,
 )
-from api.v1.utils.utility import DatabaseOp, get_obj
+from api.v1.utils.json_provider import json_response
+from api.v1.utils.utility import (
+    DatabaseOp,
+    get_obj,
+    get_obj_dict,
+    paginated_response,
+    uncache_obj,
+)
 from models import storage
 from models.product import Product
 from models.category import Category
+from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
@@ -58,8 +68,7 @@ def register_product():
 
     product = Product(**valid_data)
     product.added_by = admin
-    db = DatabaseOp()
-    db.save(product)
+    DatabaseOp.save(product)
 
     product_dict = get_product_dict(product)
     return jsonify(product_dict), 201
@@ -75,15 +84,18 @@ def get_all_products(page_size: int, page_num: int):
     """
     Get paginated list of products.
     """
-    products_objects = storage.all(Product, page_size, page_num)
-    if not products_objects:
-        abort(404, description="No product found")
-
-    product_lists: list[dict[str, Any]] = []
-    for product in products_objects:
-        product_dict = get_product_dict(product)
-        product_lists.append(product_dict)
-    return jsonify(product_lists), 200
+    return paginated_response(
+        Product,
+        page_size,
+        page_num,
+        get_product_dict,
+        options=[
+            selectinload(Product.category).load_only(Category.name),
+            selectinload(Product.added_by).load_only(Employee.username),
+        ],
+        not_found="No product found",
+        cache=False,
+    ), 200
 
 
 @app_views.route(
@@ -95,13 +107,20 @@ def get_all_products(page_size: int, page_num: int):
 def get_product(product_id: str):
     """
     Get a single product by ID.
+
+    `?expand=brands` also returns the names of the linked brands.
     """
-    product = get_obj(Product, product_id)
-    if not product:
+    product_dict = get_obj_dict(Product, product_id, get_product_dict)
+    if not product_dict:
         abort(404, description="Product does not exist")
 
-    product_dict = get_product_dict(product)
-    return jsonify(product_dict), 200
+    if "brands" in get_expand_fields():
+        # Copy, so the cached dict stays unexpanded.
+        product_dict = {
+            **product_dict,
+            "brands": list(storage.get_brand_names_for_product(product_id)),
+        }
+    return json_response(product_dict), 200
 
 
 @app_views.route(
@@ -115,21 +134,15 @@ def update_product(product_id: str):
     Update product details.
     """
     valid_data = validate_request_data(ProductUpdate)
-    product = get_obj(Product, product_id)
-    if not product:
-        abort(404, description="Product does not exist")
-
     if "category_id" in valid_data:
         category = get_obj(Category, valid_data["category_id"])
         if not category:
             abort(404, description="Category does not exist.")
-        valid_data["category"] = category
-
-    for attr, value in valid_data.items():
-        setattr(product, attr, value)
 
-    db = DatabaseOp()
-    db.save(product)
+    product = DatabaseOp.update_by_id(Product, product_id, valid_data)
+    if not product:
+        abort(404, description="Product does not exist")
+    uncache_obj(Product, product_id)
 
     product_dict = get_product_dict(product)
     return jsonify(product_dict), 200
@@ -145,11 +158,8 @@ def delete_product(product_id: str):
     """
     Delete a product.
     """
-    product = get_obj(Product, product_id)
-    if not product:
+    if not DatabaseOp.delete_by_id(Product, product_id):
         abort(404, description="Product does not exist")
 
-    db = DatabaseOp()
-    db.delete(product)
-    db.commit()
+    uncache_obj(Product, product_id)
     return jsonify({}), 200
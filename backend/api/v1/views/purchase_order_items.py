@@ -5,6 +5,7 @@ Routes for managing purchase order items.
 """
 
 from flask import abort, jsonify
+from sqlalchemy.orm import joinedload, load_only, selectinload
 from typing import Any
 import logging
 
@@ -12,10 +13,15 @@ from api.v1.auth.authorization import admin_only
 from api.v1.views import app_views
 from api.v1.utils.request_data_validation import (
     PurchaseOrderItemRegister,
+    PurchaseOrderItemsRegister,
     PurchaseOrderItemUpdate,
     validate_request_data,
 )
-from api.v1.utils.utility import DatabaseOp, get_obj
+from api.v1.utils.utility import (
+    DatabaseOp,
+    get_obj,
+    paginated_response,
+)
 from models import storage
 from models.product import Product
 from models.purchase_order import PurchaseOrder
@@ -46,24 +52,66 @@ def add_purchase_item(purchase_order_id: str):
     """
     valid_data = validate_request_data(PurchaseOrderItemRegister)
 
-    product = get_obj(Product, valid_data["product_id"])
+    product, purchase_order = storage.get_objs_by_ids(
+        (Product, valid_data["product_id"]),
+        (PurchaseOrder, purchase_order_id),
+    )
     if not product:
         abort(404, description="Product does not exist.")
-
-    purchase_order = get_obj(PurchaseOrder, purchase_order_id)
     if not purchase_order:
         abort(404, description="Order does not exist")
 
-    valid_data["purchase_order_id"] = purchase_order.id
+    valid_data["purchase_order_id"] = purchase_order_id
     purchase_order_item = PurchaseOrderItem(**valid_data)
+    purchase_order_item.product = product
 
-    db = DatabaseOp()
-    db.save(purchase_order_item)
+    DatabaseOp.save(purchase_order_item)
 
     order_item_dict = get_order_item_dict(purchase_order_item)
     return jsonify(order_item_dict), 201
 
 
+@app_views.route(
+    "/purchase_orders/<purchase_order_id>/purchase_order_items/bulk",
+    strict_slashes=False,
+    methods=["POST"],
+)
+@admin_only
+def add_purchase_items(purchase_order_id: str):
+    """
+    Add several items to a purchase order in one request.
+    """
+    valid_data = validate_request_data(PurchaseOrderItemsRegister)
+
+    purchase_order = get_obj(PurchaseOrder, purchase_order_id)
+    if not purchase_order:
+        abort(404, description="Order does not exist")
+
+    product_ids = {item["product_id"] for item in valid_data["items"]}
+    products = storage.get_objs_of_cls_by_ids(
+        Product, product_ids, options=[load_only(Product.name)]
+    )
+    missing_ids = product_ids - products.keys()
+    if missing_ids:
+        abort(
+            404,
+            description=(
+                f"Product does not exist: {', '.join(sorted(missing_ids))}"
+            ),
+        )
+
+    order_items: list[PurchaseOrderItem] = []
+    for item_data in valid_data["items"]:
+        item_data["purchase_order_id"] = purchase_order_id
+        order_item = PurchaseOrderItem(**item_data)
+        order_item.product = products[item_data["product_id"]]
+        order_items.append(order_item)
+
+    DatabaseOp.save_many(order_items)
+
+    return jsonify([get_order_item_dict(item) for item in order_items]), 201
+
+
 @app_views.route(
     "/purchases/<int:page_size>/<int:page_num>",
     strict_slashes=False,
@@ -74,15 +122,17 @@ def get_all_purchases(page_size: int, page_num: int):
     """
     Get paginated list of all purchase order items.
     """
-    purchases = storage.all(PurchaseOrderItem, page_size, page_num)
-    if not purchases:
-        abort(404, description="No purchases found")
-
-    purchases_list: list[dict[str, Any]] = []
-    for item in purchases:
-        item_dict = get_order_item_dict(item)
-        purchases_list.append(item_dict)
-    return jsonify(purchases_list), 200
+    return paginated_response(
+        PurchaseOrderItem,
+        page_size,
+        page_num,
+        get_order_item_dict,
+        options=[
+            selectinload(PurchaseOrderItem.product).load_only(Product.name),
+        ],
+        not_found="No purchases found",
+        cache=False,
+    ), 200
 
 
 @app_views.route(
@@ -99,7 +149,13 @@ def get_purchase_item(order_id: str, order_item_id: str):
     if not purchase_order:
         abort(404, description="Order does not exist.")
 
-    purchase_item = get_obj(PurchaseOrderItem, order_item_id)
+    purchase_item = get_obj(
+        PurchaseOrderItem,
+        order_item_id,
+        options=[
+            joinedload(PurchaseOrderItem.product).load_only(Product.name),
+        ],
+    )
     if not purchase_item:
         abort(404, description="Item does not exist.")
 
@@ -119,25 +175,21 @@ def update_purchase_order_item(order_id: str, order_item_id: str):
     """
     valid_data = validate_request_data(PurchaseOrderItemUpdate)
 
-    if "product_id" in valid_data:
-        product = get_obj(Product, valid_data["product_id"])
-        if not product:
-            abort(404, description="Product does not exist.")
-
-    purchase_order = get_obj(PurchaseOrder, order_id)
+    product, purchase_order = storage.get_objs_by_ids(
+        (Product, valid_data.get("product_id")),
+        (PurchaseOrder, order_id),
+    )
+    if "product_id" in valid_data and not product:
+        abort(404, description="Product does not exist.")
     if not purchase_order:
         abort(404, description="Order does not exist.")
 
-    order_item = get_obj(PurchaseOrderItem, order_item_id)
+    order_item = DatabaseOp.update_by_id(
+        PurchaseOrderItem, order_item_id, valid_data
+    )
     if not order_item:
         abort(404, description="Item does not exist.")
 
-    for attr, value in valid_data.items():
-        setattr(order_item, attr, value)
-
-    db = DatabaseOp()
-    db.save(order_item)
-
     order_item_dict = get_order_item_dict(order_item)
     return jsonify(order_item_dict), 200
 
@@ -156,11 +208,6 @@ def delete_purchase_order_item(order_id: str, order_item_id: str):
     if not purchase_order:
         abort(404, description="Order does not exist.")
 
-    order_item = get_obj(PurchaseOrderItem, order_item_id)
-    if not order_item:
+    if not DatabaseOp.delete_by_id(PurchaseOrderItem, order_item_id):
         abort(404, description="Item does not exist.")
-
-    db = DatabaseOp()
-    db.delete(order_item)
-    db.commit()
     return jsonify({}), 200
@@ -5,6 +5,7 @@ Routes for managing purchase orders.
 """
 
 from flask import abort, jsonify, g
+from sqlalchemy.orm import joinedload, selectinload
 from typing import Any
 import logging
 
@@ -15,10 +16,10 @@ from api.v1.utils.request_data_validation import (
     PurchaseOrderUpdate,
     validate_request_data,
 )
-from api.v1.utils.utility import DatabaseOp, get_obj
-from models import storage
+from api.v1.utils.utility import DatabaseOp, get_obj, paginated_response
 from models.brand import Brand
 from models.purchase_order import PurchaseOrder
+from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
@@ -52,9 +53,12 @@ def register_purchase_order():
 
     valid_data["employee_id"] = admin.id
     purchase_order = PurchaseOrder(**valid_data)
+    # Attach the objects already loaded so the response is built from the
+    # identity map instead of lazy-loading them again after the commit.
+    purchase_order.brand = brand
+    purchase_order.added_by = admin
 
-    db = DatabaseOp()
-    db.save(purchase_order)
+    DatabaseOp.save(purchase_order)
 
     purchase_order_dict = get_purchase_order_dict(purchase_order)
     return jsonify(purchase_order_dict), 201
@@ -70,15 +74,17 @@ def get_all_purchase_orders(page_size: int, page_num: int):
     """
     Get paginated list of all purchase orders.
     """
-    purchase_orders_objects = storage.all(PurchaseOrder, page_size, page_num)
-    if not purchase_orders_objects:
-        abort(404, description="No purchase_order found")
-
-    purchase_order_lists: list[dict[str, Any]] = []
-    for purchase_order in purchase_orders_objects:
-        purchase_order_dict = get_purchase_order_dict(purchase_order)
-        purchase_order_lists.append(purchase_order_dict)
-    return jsonify(purchase_order_lists), 200
+    return paginated_response(
+        PurchaseOrder,
+        page_size,
+        page_num,
+        get_purchase_order_dict,
+        options=[
+            selectinload(PurchaseOrder.brand).load_only(Brand.name),
+            selectinload(PurchaseOrder.added_by).load_only(Employee.username),
+        ],
+        not_found="No purchase_order found",
+    ), 200
 
 
 @app_views.route(
@@ -91,7 +97,14 @@ def get_purchase_order(purchase_order_id: str):
     """
     Get details of a purchase order by ID.
     """
-    purchase_order = get_obj(PurchaseOrder, purchase_order_id)
+    purchase_order = get_obj(
+        PurchaseOrder,
+        purchase_order_id,
+        options=[
+            joinedload(PurchaseOrder.brand).load_only(Brand.name),
+            joinedload(PurchaseOrder.added_by).load_only(Employee.username),
+        ],
+    )
     if not purchase_order:
         abort(404, description="Order does not exist")
 
@@ -110,21 +123,15 @@ def update_purchase_order(purchase_order_id: str):
     Update an existing purchase order.
     """
     valid_data = validate_request_data(PurchaseOrderUpdate)
-    if "brand_id" in valid_data:
-        brand = get_obj(Brand, valid_data["brand_id"])
-        if not brand:
-            abort(404, description="Brand does not exist.")
+    if "brand_id" in valid_data and not get_obj(Brand, valid_data["brand_id"]):
+        abort(404, description="Brand does not exist.")
 
-    purchase_order = get_obj(PurchaseOrder, purchase_order_id)
+    purchase_order = DatabaseOp.update_by_id(
+        PurchaseOrder, purchase_order_id, valid_data
+    )
     if not purchase_order:
         abort(404, description="Purchase_order does not exist")
 
-    for attr, value in valid_data.items():
-        setattr(purchase_order, attr, value)
-
-    db = DatabaseOp()
-    db.save(purchase_order)
-
     purchase_order_dict = get_purchase_order_dict(purchase_order)
     return jsonify(purchase_order_dict), 200
 
@@ -139,11 +146,6 @@ def delete_purchase_order(purchase_order_id: str):
     """
     Delete a purchase order.
     """
-    purchase_order = get_obj(PurchaseOrder, purchase_order_id)
-    if not purchase_order:
+    if not DatabaseOp.delete_by_id(PurchaseOrder, purchase_order_id):
         abort(404, description="Purchase_order does not exist")
-
-    db = DatabaseOp()
-    db.delete(purchase_order)
-    db.commit()
     return jsonify({}), 200
@@ -5,6 +5,7 @@ Handles CRUD operations for sales via API routes.
 """
 
 from flask import abort, jsonify, g
+from sqlalchemy.orm import joinedload, selectinload
 from typing import Any
 import logging
 
@@ -15,11 +16,12 @@ from api.v1.utils.request_data_validation import (
     SaleUpdate,
     validate_request_data,
 )
-from api.v1.utils.utility import DatabaseOp, get_obj
+from api.v1.utils.utility import DatabaseOp, get_obj, paginated_response
 from models import storage
 from models.brand import Brand
 from models.product import Product
 from models.sale import Sale
+from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
@@ -45,8 +47,10 @@ def add_sale_item():
     admin = g.current_employee
 
     valid_data = validate_request_data(SaleRegister)
-    brand = get_obj(Brand, valid_data["brand_id"])
-    product = get_obj(Product, valid_data["product_id"])
+    brand, product = storage.get_objs_by_ids(
+        (Brand, valid_data["brand_id"]),
+        (Product, valid_data["product_id"]),
+    )
 
     if not brand:
         abort(404, description="Brand does not exist.")
@@ -55,8 +59,10 @@ def add_sale_item():
 
     valid_data["employee_id"] = admin.id
     sale = Sale(**valid_data)
-    db = DatabaseOp()
-    db.save(sale)
+    sale.brand = brand
+    sale.product = product
+    sale.added_by = admin
+    DatabaseOp.save(sale)
 
     sale_dict = get_sale_dict(sale)
     return jsonify(sale_dict), 201
@@ -72,15 +78,18 @@ def get_all_sales(page_size: int, page_num: int):
     """
     Retrieves all sales with pagination.
     """
-    sales = storage.all(Sale, page_size, page_num)
-    if not sales:
-        abort(404, description="No sales found")
-
-    sales_list: list[dict[str, Any]] = []
-    for item in sales:
-        item_dict = get_sale_dict(item)
-        sales_list.append(item_dict)
-    return jsonify(sales_list), 200
+    return paginated_response(
+        Sale,
+        page_size,
+        page_num,
+        get_sale_dict,
+        options=[
+            selectinload(Sale.product).load_only(Product.name),
+            selectinload(Sale.brand).load_only(Brand.name),
+            selectinload(Sale.added_by).load_only(Employee.username),
+        ],
+        not_found="No sales found",
+    ), 200
 
 
 @app_views.route(
@@ -93,7 +102,15 @@ def get_sale_item(sale_id: str):
     """
     Retrieves a single sale record by ID.
     """
-    sale = get_obj(Sale, sale_id)
+    sale = get_obj(
+        Sale,
+        sale_id,
+        options=[
+            joinedload(Sale.product).load_only(Product.name),
+            joinedload(Sale.brand).load_only(Brand.name),
+            joinedload(Sale.added_by).load_only(Employee.username),
+        ],
+    )
     if not sale:
         abort(404, description="Item does not exist")
 
@@ -113,25 +130,20 @@ def update_sale_item(sale_id: str):
     """
     valid_data = validate_request_data(SaleUpdate)
 
-    if "brand_id" in valid_data:
-        brand = get_obj(Brand, valid_data["brand_id"])
-        if not brand:
+    if "brand_id" in valid_data or "product_id" in valid_data:
+        brand, product = storage.get_objs_by_ids(
+            (Brand, valid_data.get("brand_id")),
+            (Product, valid_data.get("product_id")),
+        )
+        if "brand_id" in valid_data and not brand:
             abort(404, description="Brand does not exist.")
-    if "product_id" in valid_data:
-        product = get_obj(Product, valid_data["product_id"])
-        if not product:
+        if "product_id" in valid_data and not product:
             abort(404, description="Product does not exist.")
 
-    sale = get_obj(Sale, sale_id)
+    sale = DatabaseOp.update_by_id(Sale, sale_id, valid_data)
     if not sale:
         abort(404, description="Item does not exist")
 
-    for attr, value in valid_data.items():
-        setattr(sale, attr, value)
-
-    db = DatabaseOp()
-    db.save(sale)
-
     sale_dict = get_sale_dict(sale)
     return jsonify(sale_dict), 200
 
@@ -146,11 +158,6 @@ def delete_sale_item(sale_id: str):
     """
     Deletes a sale record by ID.
     """
-    sale = get_obj(Sale, sale_id)
-    if not sale:
+    if not DatabaseOp.delete_by_id(Sale, sale_id):
         abort(404, description="Item does not exist")
-
-    db = DatabaseOp()
-    db.delete(sale)
-    db.commit()
     return jsonify({}), 200
@@ -9,14 +9,14 @@ from dotenv import load_dotenv
 from flask import abort, jsonify
 import logging
 
-from api.v1.views import app_views
+from api.v1.views import app_views, public_views
 from api.v1.auth.authentication import LoginAuth
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-@app_views.route(
+@public_views.route(
         "/auth_session/login",
         strict_slashes=False,
         methods=["POST"]
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+"""
+Gunicorn settings for serving the Pharmacy API.
+"""
+
+import multiprocessing
+import os
+
+bind = "0.0.0.0:5000"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+
+# gevent multiplexes many requests per worker while they wait on the
+# database; set GUNICORN_WORKER_CLASS=gthread to use OS threads instead.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+# Import the app once in the master so workers fork with it loaded.
+# gevent patches the standard library when a worker starts, so the app
+# must be imported after that, inside each worker.
+preload_app = worker_class != "gevent"
+
+
+def post_fork(server, worker):
+    """
+    Prepare a freshly forked worker.
+
+    gevent workers make psycopg2 yield to other greenlets while waiting
+    on the database. Preloaded workers give up the database connections
+    inherited from the master and open their own.
+    """
+    if worker_class == "gevent":
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+
+    if preload_app:
+        from models import storage
+
+        storage.dispose()
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+"""
+Applies the pending schema migrations to the configured database.
+
+The deploy job in .github/workflows/deploy.yml runs it after building
+the new image and before starting the app on it:
+
+    docker compose run --rm backend python migrate.py
+
+The app itself refuses to start while a migration is pending; see
+models/engine/migrations.py.
+"""
+
+import os
+
+os.environ["RUN_MIGRATIONS"] = "1"
+
+import models  # noqa: E402,F401  storage.reload() applies them
@@ -49,7 +49,13 @@ def setup_production_database() -> str:
 
 def setup_test_database() -> str:
     """
+    TEST_DATABASE_URL, when set, replaces the Postgres test settings,
+    e.g. "sqlite://" to run the suite against an in-memory database.
     """
+    test_database_url = os.getenv("TEST_DATABASE_URL")
+    if test_database_url:
+        return test_database_url
+
     test_database_user = os.getenv("TEST_DATABASE_USER")
     test_database_password = os.getenv("TEST_DATABASE_PASSWORD")
     test_database_name = os.getenv("TEST_DATABASE_NAME")
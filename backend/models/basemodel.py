@@ -5,13 +5,18 @@
 Base model for all database classes.
 """
 
-from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from sqlalchemy.orm import DeclarativeBase, mapped_column
-from sqlalchemy import String, DateTime
+from sqlalchemy.orm import DeclarativeBase, declared_attr, mapped_column
+from sqlalchemy import Enum as SQLEnum, DateTime, Index, Uuid, inspect
 from typing import Any
 from uuid import uuid4
+import functools
+
+
+# Record IDs and the foreign keys to them: a native 16-byte UUID on
+# Postgres, while Python code keeps the hyphenated strings.
+UUIDStr = Uuid(as_uuid=False)
 
 
 class Base(DeclarativeBase):
@@ -22,32 +27,75 @@ class Base(DeclarativeBase):
 class BaseModel:
     """Common model with id, timestamps, and basic DB helpers."""
 
-    id = mapped_column(String(36), primary_key=True, sort_order=-3)
+    id = mapped_column(UUIDStr, primary_key=True, sort_order=-3)
     created_at = mapped_column(DateTime, default=datetime.now, sort_order=-2)
     last_updated = mapped_column(DateTime, default=datetime.now, sort_order=-1)
 
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        """Index the (created_at, id) order list pages are read in."""
+        return (
+            Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),
+        )
+
     def __init__(self, **kwargs: Any) -> None:
         """Create new model instance."""
         self.id = str(uuid4())
-        self.created_at = datetime.now()
-        self.last_updated = datetime.now()
-        if kwargs:
-            kwargs.pop("id", None)
-            kwargs.pop("created_at", None)
-            kwargs.pop("last_updated", None)
-            self.__dict__.update(kwargs)
+        self.created_at = self.last_updated = datetime.now()
+        settable_names = self.settable_names()
+        for key, value in kwargs.items():
+            if key in settable_names:
+                setattr(self, key, value)
+            elif key not in ("id", "created_at", "last_updated"):
+                raise TypeError(
+                    f"{key!r} is an invalid keyword argument for "
+                    f"{self.__class__.__name__}"
+                )
 
         from models import storage
         storage.new(self)
 
     def __str__(self) -> str:
         """Readable string form of the object."""
-        obj_dict = deepcopy(self.__dict__)
-        obj_dict.pop("_sa_instance_state", None)
+        # The loaded values are all immutable, so a shallow copy will do.
+        obj_dict = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_sa_instance_state", "password")
+        }
         obj_dict["created_at"] = self.created_at.isoformat()
         obj_dict["last_updated"] = self.last_updated.isoformat()
         return f"[{self.__class__.__name__}.{self.id}] ({obj_dict})"
 
+    @classmethod
+    @functools.cache
+    def column_names(cls) -> tuple[str, ...]:
+        """Names of the mapped columns included in `to_dict`."""
+        return tuple(
+            column.key
+            for column in inspect(cls).column_attrs
+            if column.key != "password"
+        )
+
+    @classmethod
+    @functools.cache
+    def enum_column_names(cls) -> tuple[str, ...]:
+        """Names of the `to_dict` columns that hold Enum members."""
+        mapper = inspect(cls)
+        return tuple(
+            column
+            for column in cls.column_names()
+            if isinstance(mapper.columns[column].type, SQLEnum)
+        )
+
+    @classmethod
+    @functools.cache
+    def settable_names(cls) -> frozenset[str]:
+        """Mapped attributes the constructor sets from its kwargs."""
+        return frozenset(inspect(cls).attrs.keys()) - {
+            "id", "created_at", "last_updated"
+        }
+
     def delete(self) -> None:
         """Remove object from storage."""
         from models import storage
@@ -55,9 +103,10 @@ class BaseModel:
 
     def get_enum_value(self, obj_dict: dict[str, Any]) -> dict[str, Any]:
         """Replace Enum fields with their values."""
-        for attr, val in obj_dict.items():
-            if isinstance(val, Enum):
-                obj_dict[attr] = val.value
+        for column in self.enum_column_names():
+            value = obj_dict.get(column)
+            if isinstance(value, Enum):
+                obj_dict[column] = value.value
         return obj_dict
 
     def save(self) -> None:
@@ -68,13 +117,14 @@ class BaseModel:
         storage.save()
 
     def to_dict(self) -> dict[str, Any]:
-        """Return dict version of the object."""
-        obj_dict = deepcopy(self.__dict__)
-
-        obj_dict["created_at"] = obj_dict["created_at"].isoformat()
-        obj_dict["last_updated"] = obj_dict["last_updated"].isoformat()
-        obj_dict.pop("password", None)
-        obj_dict.pop("_sa_instance_state", None)
+        """
+        Return dict version of the object's columns.
+
+        Timestamps stay datetime objects; the JSON encoder writes them
+        in ISO 8601 format.
+        """
+        obj_dict = {
+            column: getattr(self, column) for column in self.column_names()
+        }
         obj_dict["__class__"] = self.__class__.__name__
-        obj_dict = self.get_enum_value(obj_dict)
-        return obj_dict
+        return self.get_enum_value(obj_dict)
@@ -7,7 +7,7 @@ Brand model and brand-product link table.
 from sqlalchemy.orm import mapped_column, relationship
 from sqlalchemy import Table, Column, ForeignKey, String, Boolean
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 
 
 brand_products = Table(
@@ -15,15 +15,16 @@ brand_products = Table(
     Base.metadata,
     Column(
         "brand_id",
-        String(36),
+        UUIDStr,
         ForeignKey("brands.id", ondelete="CASCADE"),
         primary_key=True,
     ),
     Column(
         "product_id",
-        String(36),
+        UUIDStr,
         ForeignKey("products.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -36,10 +37,11 @@ class Brand(BaseModel, Base):
     name = mapped_column(String(200), nullable=False, unique=True)
     is_active = mapped_column(Boolean, default=True)
     employee_id = mapped_column(
-        String(36),
-        ForeignKey("employees.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("employees.id", ondelete="SET NULL"),
+        index=True,
     )
-    added_by = relationship("Employee", backref="brands")
+    added_by = relationship("Employee", back_populates="brands")
     products = relationship(
         "Product",
         secondary=brand_products,
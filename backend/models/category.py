@@ -7,7 +7,7 @@ Category model.
 from sqlalchemy.orm import mapped_column, relationship
 from sqlalchemy import ForeignKey, String
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 
 
 class Category(BaseModel, Base):
@@ -18,8 +18,9 @@ class Category(BaseModel, Base):
     name = mapped_column(String(200), unique=True)
     description = mapped_column(String(2000))
     employee_id = mapped_column(
-        String(36),
-        ForeignKey("employees.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("employees.id", ondelete="SET NULL"),
+        index=True,
     )
-    added_by = relationship("Employee", backref="categories_added")
+    added_by = relationship("Employee", back_populates="categories_added")
     products = relationship("Product", back_populates="category")
@@ -30,6 +30,23 @@ class Employee(BaseModel, Base):
         back_populates="employee",
         cascade="all, delete-orphan"
     )
+    # The foreign keys are ON DELETE SET NULL, so deleting an employee
+    # leaves these rows to the database instead of loading them first.
+    brands = relationship(
+        "Brand", back_populates="added_by", passive_deletes=True
+    )
+    categories_added = relationship(
+        "Category", back_populates="added_by", passive_deletes=True
+    )
+    products_added = relationship(
+        "Product", back_populates="added_by", passive_deletes=True
+    )
+    purchase_orders_added = relationship(
+        "PurchaseOrder", back_populates="added_by", passive_deletes=True
+    )
+    sales = relationship(
+        "Sale", back_populates="added_by", passive_deletes=True
+    )
 
     @classmethod
     def search_employee_by_email_username(
@@ -41,3 +58,14 @@ class Employee(BaseModel, Base):
         from models import storage
 
         return storage.search_employee_by_email_username(email, username)
+
+    @classmethod
+    def search_by_email_or_username(
+        cls,
+        email: str | None = None,
+        username: str | None = None
+    ):
+        """Find employees matching the email or the username."""
+        from models import storage
+
+        return storage.search_employees_by_email_or_username(email, username)
@@ -5,10 +5,10 @@ Employee session model.
 """
 
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import ForeignKey
 from sqlalchemy.orm import mapped_column, relationship
 
-from models.basemodel import BaseModel, Base
+from models.basemodel import BaseModel, Base, UUIDStr
 
 
 class EmployeeSession(BaseModel, Base):
@@ -17,9 +17,10 @@ class EmployeeSession(BaseModel, Base):
     __tablename__ = "employee_sessions"
 
     employee_id = mapped_column(
-        String(36),
+        UUIDStr,
         ForeignKey("employees.id"),
-        nullable=False
+        nullable=False,
+        index=True,
     )
 
     employee = relationship(
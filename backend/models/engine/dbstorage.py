@@ -4,16 +4,46 @@
 Database storage engine for managing all model interactions.
 """
 
-from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy import create_engine, select, func, Select
-from typing import Any, Sequence, Type, TypeVar, Tuple
+from datetime import datetime
+from dotenv import load_dotenv
+from itertools import chain, count
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy import (
+    create_engine,
+    event,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+    Select,
+)
+from sqlalchemy.engine import CursorResult, make_url
+from sqlalchemy.pool import StaticPool
+from typing import (
+    Any,
+    Collection,
+    Iterable,
+    Sequence,
+    Type,
+    TypeVar,
+    Tuple,
+    cast,
+)
+from uuid import UUID
 import logging
+import os
 
 from models.basemodel import Base, BaseModel
 from models.brand import Brand, brand_products
 from models.category import Category
 from models.employee import Employee
 from models.employee_session import EmployeeSession
+from models.engine.migrations import apply_migrations, pending_migrations
 from models.product import Product
 from models.purchase_order import PurchaseOrder
 from models.purchase_order_item import PurchaseOrderItem
@@ -21,14 +51,58 @@ from models.sale import Sale
 from models.stock_level import StockLevel
 
 
+load_dotenv()
 logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 15))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+# Set only for the one-off `python migrate.py` deploy step.
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS") == "1"
+
+_generation_counter = count(1)
+
+# Durability settings that are pointless for a throwaway test database
+# and otherwise cost an fsync on every commit, plus foreign-key
+# enforcement, which SQLite leaves off by default: without it the
+# ON DELETE rules the storage layer relies on never run under test.
+SQLITE_TEST_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def is_valid_id(id: Any) -> bool:
+    """
+    Tells whether `id` can be a record ID at all.
+
+    IDs are native UUIDs on Postgres, which rejects a malformed one with
+    an error instead of matching no row, so lookups by IDs taken from
+    URLs or cookies check them first and treat bad ones as not found.
+    """
+    try:
+        UUID(id)
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return True
+
+
+def _tune_sqlite_connection(dbapi_connection: Any, record: Any) -> None:
+    """Applies SQLITE_TEST_PRAGMAS to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_TEST_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class DBStorage:
     """Handles all database operations for the application."""
 
-    __classes: list[Type[BaseModel]] = [
+    # Ordered for the count() result; the frozenset is for lookups.
+    __classes: tuple[Type[BaseModel], ...] = (
         Brand,
         Category,
         Employee,
@@ -38,15 +112,61 @@ class DBStorage:
         Sale,
         StockLevel,
         EmployeeSession,
-    ]
+    )
+    __class_set: frozenset[Type[BaseModel]] = frozenset(__classes)
 
     def __init__(self, database_url: str) -> None:
         """Initializes the database engine with the provided URL."""
-        self.__engine = create_engine(database_url, pool_pre_ping=True)
+        if make_url(database_url).get_backend_name() == "sqlite":
+            # Test runs only: one connection shared by every thread, so
+            # an in-memory database is the same database for all of them.
+            self.__engine = create_engine(
+                database_url,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+            event.listen(self.__engine, "connect", _tune_sqlite_connection)
+        else:
+            self.__engine = create_engine(
+                database_url,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                pool_recycle=DB_POOL_RECYCLE,
+            )
+        self.__generations: dict[type, int] = {}
+
+        # One registry for the process; close() hands each thread's
+        # session back to it at the end of a request.
+        session_factory = sessionmaker(
+            bind=self.__engine, expire_on_commit=False
+        )
+        event.listen(session_factory, "after_flush", self._on_after_flush)
+        event.listen(session_factory, "after_commit", self._on_after_commit)
+        event.listen(
+            session_factory, "after_rollback", self._on_after_rollback
+        )
+        self.__session = scoped_session(session_factory)
 
-    def all(self, cls: Type[T], page_size: int, page_num: int) -> Sequence[T]:
+    def all(
+        self,
+        cls: Type[T],
+        page_size: int,
+        page_num: int,
+        options: Sequence[ExecutableOption] = (),
+        after: Tuple[datetime, str] | None = None,
+    ) -> Sequence[T]:
         """
         Returns paginated results for all records of a given model class.
+
+        Records come in (created_at, id) order. `after` is the
+        (created_at, id) of the last record already seen: the query then
+        seeks past it on the model's index, and `page_num` counts pages
+        from there, so a client that passes each page's last record
+        along reads deep pages without an ever-growing OFFSET.
+
+        `options` are applied to the query, e.g. `selectinload(...)` to
+        eager-load relationships the caller is going to read.
         """
         if not issubclass(cls, BaseModel):  # type: ignore
             raise TypeError("Cls must inherit from BaseModel")
@@ -59,52 +179,214 @@ class DBStorage:
         if page_num <= 0:
             raise ValueError("Page number must be greater than 0")
 
+        query = select(cls).options(*options)
+        if after is not None:
+            query = query.where(tuple_(cls.created_at, cls.id) > after)
         cls_objects = self.__session.scalars(
-            select(cls).offset((page_num - 1) * page_size).limit(page_size)
+            query.order_by(cls.created_at, cls.id)
+            .offset((page_num - 1) * page_size)
+            .limit(page_size)
         ).all()
 
         return cls_objects
 
     def count(self, cls: Type[T] | None = None) -> int | dict[str, Any] | None:
         """Returns the count of records for a model or all models."""
-        if cls in self.__classes:
+        if cls in self.__class_set:
             count_cls_objects: int | None = self.__session.scalar(
                 select(func.count()).select_from(cls)
             )
             return count_cls_objects
 
-        count_all_objects: dict[str, Any] = {}
-        for cls_name in self.__classes:
-            count_cls_obj = self.__session.scalar(
-                select(func.count()).select_from(cls_name)
+        counts = union_all(
+            *(
+                select(literal(model.__name__), func.count()).select_from(
+                    model
+                )
+                for model in self.__classes
             )
-            count_all_objects[cls_name.__name__] = count_cls_obj
+        )
+        count_all_objects: dict[str, Any] = {
+            name: count for name, count in self.__session.execute(counts)
+        }
         return count_all_objects
 
     def close(self):
-        """Closes the current database session."""
-        self.__session.close()
+        """
+        Removes the current scoped session, returning its connection
+        to the pool. Does nothing if no session was opened on this
+        thread.
+        """
+        self.__session.remove()
 
     def delete(self, obj: BaseModel) -> None:
         """Deletes an object from the current session."""
         self.__session.delete(obj)
 
-    def get_obj_by_id(self, cls: Type[T], id: str) -> T | None:
-        """Fetches a single object by its ID."""
-        if issubclass(cls, BaseModel):  # type: ignore
-            obj = self.__session.get(cls, id)
+    def delete_by_id(self, cls: Type[T], id: str) -> int:
+        """
+        Deletes a record by ID with a single DELETE statement and
+        returns the number of rows removed.
+
+        The row is not loaded first, so related rows are handled by the
+        foreign keys' ON DELETE rules rather than by ORM cascades.
+        """
+        if not is_valid_id(id):
+            return 0
+        result = self.__session.execute(delete(cls).where(cls.id == id))
+        self._mark_changed(self.__session(), cls)
+        return cast(CursorResult[Any], result).rowcount
+
+    def delete_by_ids(self, cls: Type[T], ids: Collection[str]) -> int:
+        """
+        Deletes every record whose ID is in `ids` with a single DELETE
+        statement and returns the number of rows removed.
+
+        As with `delete_by_id`, related rows are left to the foreign
+        keys' ON DELETE rules.
+        """
+        ids = [id for id in ids if is_valid_id(id)]
+        if not ids:
+            return 0
+        result = self.__session.execute(delete(cls).where(cls.id.in_(ids)))
+        self._mark_changed(self.__session(), cls)
+        return cast(CursorResult[Any], result).rowcount
+
+    def dispose(self) -> None:
+        """
+        Drops pooled connections inherited from a parent process
+        without closing them, so a forked worker opens its own.
+        """
+        self.__engine.dispose(close=False)
+
+    def generation(self, cls: Type[BaseModel]) -> int:
+        """
+        Returns a number that changes whenever this process commits a
+        write to the model's table, for use in cache keys.
+        """
+        return self.__generations.get(cls, 0)
+
+    def _mark_changed(self, session: Session, *classes: type) -> None:
+        """Records models written in the session's transaction."""
+        session.info.setdefault("changed_classes", set()).update(classes)
+
+    def _on_after_flush(self, session: Session, flush_context: Any) -> None:
+        """Notes the models of every flushed object."""
+        self._mark_changed(
+            session,
+            *(
+                type(obj)
+                for obj in chain(session.new, session.dirty, session.deleted)
+            ),
+        )
+
+    def _on_after_commit(self, session: Session) -> None:
+        """Bumps the generation of every model the commit wrote to."""
+        for cls in session.info.pop("changed_classes", ()):
+            self.__generations[cls] = next(_generation_counter)
+
+    def _on_after_rollback(self, session: Session) -> None:
+        """Forgets writes that were rolled back."""
+        session.info.pop("changed_classes", None)
+
+    def get_brand_names_for_product(self, product_id: str) -> Sequence[str]:
+        """Returns the names of the brands linked to a product."""
+        stmt = (
+            select(Brand.name)
+            .join(brand_products, brand_products.c.brand_id == Brand.id)
+            .where(brand_products.c.product_id == product_id)
+        )
+        return self.__session.scalars(stmt).all()
+
+    def get_product_names_for_brand(self, brand_id: str) -> Sequence[str]:
+        """Returns the names of the products linked to a brand."""
+        stmt = (
+            select(Product.name)
+            .join(brand_products, brand_products.c.product_id == Product.id)
+            .where(brand_products.c.brand_id == brand_id)
+        )
+        return self.__session.scalars(stmt).all()
+
+    def get_obj_by_id(
+        self,
+        cls: Type[T],
+        id: str,
+        options: Sequence[ExecutableOption] = (),
+    ) -> T | None:
+        """
+        Fetches a single object by its ID.
+
+        `options` are applied when the object has to be loaded, e.g.
+        `joinedload(...)` for many-to-one relationships the caller is
+        going to read.
+        """
+        if issubclass(cls, BaseModel) and is_valid_id(id):  # type: ignore
+            obj = self.__session.get(cls, id, options=options)
             return obj
 
+    def get_objs_by_ids(
+        self, *pairs: tuple[Type[BaseModel], str | None]
+    ) -> tuple[Any, ...]:
+        """
+        Fetches one object per (class, ID) pair in a single query,
+        returning None in place of any that do not exist or whose ID
+        is None or malformed. The classes must be distinct.
+
+        Each class is LEFT OUTER JOINed by ID onto a one-row anchor,
+        so a missing record does not hide the others.
+        """
+        anchor = select(literal(1).label("anchor")).subquery()
+        stmt = select(*(cls for cls, _ in pairs)).select_from(anchor)
+        for cls, id in pairs:
+            if not is_valid_id(id):
+                id = None
+            stmt = stmt.outerjoin(cls, cls.id == id)
+        return tuple(self.__session.execute(stmt).one())
+
+    def get_objs_of_cls_by_ids(
+        self,
+        cls: Type[T],
+        ids: Collection[str],
+        options: Sequence[ExecutableOption] = (),
+    ) -> dict[str, T]:
+        """
+        Fetches the objects of one class whose IDs are in `ids`, keyed
+        by ID. IDs with no matching record are absent from the result.
+        """
+        ids = [id for id in ids if is_valid_id(id)]
+        if not ids:
+            return {}
+        stmt = select(cls).where(cls.id.in_(ids)).options(*options)
+        return {obj.id: obj for obj in self.__session.scalars(stmt)}
+
     def new(self, obj: BaseModel):
         """Adds a new object to the current session."""
         self.__session.add(obj)
 
+    def new_all(self, objs: Iterable[BaseModel]):
+        """Adds several new objects to the current session."""
+        self.__session.add_all(objs)
+
     def reload(self):
-        """Creates all tables and initializes a scoped session."""
+        """
+        Creates all tables.
+
+        Existing tables are never altered here: with RUN_MIGRATIONS set
+        the pending schema migrations are applied first, otherwise a
+        database that still needs one is refused.
+        """
+        with self.__engine.begin() as connection:
+            if RUN_MIGRATIONS:
+                apply_migrations(connection)
+            else:
+                pending = pending_migrations(connection)
+                if pending:
+                    raise RuntimeError(
+                        "Database schema needs migrations "
+                        f"{', '.join(pending)}; run `python migrate.py` "
+                        "before starting the app."
+                    )
         Base.metadata.create_all(self.__engine)
-        self.__session = scoped_session(
-            sessionmaker(bind=self.__engine, expire_on_commit=False)
-        )
 
     def save(self):
         """Commits all pending changes to the database."""
@@ -131,3 +413,40 @@ class DBStorage:
             stmt = select(Employee).where(Employee.username == username)
         employee = self.__session.scalars(stmt).one_or_none()
         return employee
+
+    def search_employees_by_email_or_username(
+        self, email: str | None = None, username: str | None = None
+    ) -> Sequence[Employee]:
+        """Finds employees matching the email or the username."""
+        if not email and not username:
+            raise ValueError("Either email or username is required")
+
+        conditions: list[Any] = []
+        if email:
+            conditions.append(Employee.email == email)
+        if username:
+            conditions.append(Employee.username == username)
+        stmt = select(Employee).where(or_(*conditions)).limit(2)
+        return self.__session.scalars(stmt).all()
+
+    def update_by_id(
+        self, cls: Type[T], id: str, values: dict[str, Any]
+    ) -> T | None:
+        """
+        Updates a record's columns with a single UPDATE ... RETURNING
+        statement and returns the refreshed object, or None if no
+        record has that ID.
+        """
+        if not is_valid_id(id):
+            return None
+        stmt = (
+            update(cls)
+            .where(cls.id == id)
+            .values(**values, last_updated=datetime.now())
+            .returning(cls)
+        )
+        obj = self.__session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one_or_none()
+        self._mark_changed(self.__session(), cls)
+        return obj
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""
+Schema changes that `create_all` cannot make to existing tables.
+
+Each migration is a (name, is_pending, apply) triple, applied in order.
+DBStorage.reload() refuses to start on a database with a pending
+migration. The deploy job applies them before the app starts with:
+
+    docker compose run --rm backend python migrate.py
+"""
+
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.schema import AddConstraint, CreateIndex, Index
+from sqlalchemy.types import Float, Numeric, Uuid
+from typing import Callable
+import logging
+
+from models.basemodel import Base
+
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key, so two deploys cannot migrate at once.
+MIGRATION_LOCK_KEY = 727_001
+
+
+def legacy_id_columns(connection: Connection) -> list[tuple[str, str]]:
+    """
+    Returns the (table, column) pairs mapped as UUIDStr that an existing
+    Postgres database still stores as another type, e.g. varchar(36).
+    """
+    if connection.dialect.name != "postgresql":
+        return []
+
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    legacy_columns: list[tuple[str, str]] = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        db_types = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns(table.name)
+        }
+        for column in table.columns:
+            db_type = db_types.get(column.name)
+            if (
+                isinstance(column.type, Uuid)
+                and db_type is not None
+                and not isinstance(db_type, Uuid)
+            ):
+                legacy_columns.append((table.name, column.name))
+    return legacy_columns
+
+
+def convert_ids_to_uuid(connection: Connection) -> None:
+    """
+    Converts every id and foreign-key column to the native uuid type.
+
+    Foreign keys can only join columns of the same type, so every one on
+    the mapped tables is dropped first and re-created from the models,
+    with their ON DELETE rules, once the columns are converted.
+    """
+    quote = connection.dialect.identifier_preparer.quote
+    inspector = inspect(connection)
+    existing_tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if inspector.has_table(table.name)
+    ]
+
+    for table in existing_tables:
+        for foreign_key in inspector.get_foreign_keys(table.name):
+            connection.execute(text(
+                f"ALTER TABLE {quote(table.name)} "
+                f"DROP CONSTRAINT {quote(foreign_key['name'])}"
+            ))
+
+    for table_name, column_name in legacy_id_columns(connection):
+        logger.info("Converting %s.%s to uuid", table_name, column_name)
+        connection.execute(text(
+            f"ALTER TABLE {quote(table_name)} "
+            f"ALTER COLUMN {quote(column_name)} TYPE uuid "
+            f"USING {quote(column_name)}::uuid"
+        ))
+
+    for table in existing_tables:
+        for constraint in table.foreign_key_constraints:
+            connection.execute(AddConstraint(constraint))
+
+
+def missing_indexes(connection: Connection) -> list[Index]:
+    """
+    Returns the model indexes that an existing table does not have yet:
+    the (created_at, id) list-page indexes and the foreign-key indexes.
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    missing: list[Index] = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        db_indexes = {
+            index["name"] for index in inspector.get_indexes(table.name)
+        }
+        missing.extend(
+            index for index in table.indexes if index.name not in db_indexes
+        )
+    return missing
+
+
+def legacy_numeric_columns(
+    connection: Connection,
+) -> list[tuple[str, str, Numeric]]:
+    """
+    Returns the (table, column, type) of every column mapped as a fixed
+    Numeric, e.g. the sale prices, that Postgres still stores as another
+    type such as double precision.
+    """
+    if connection.dialect.name != "postgresql":
+        return []
+
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    legacy_columns: list[tuple[str, str, Numeric]] = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        db_types = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns(table.name)
+        }
+        for column in table.columns:
+            db_type = db_types.get(column.name)
+            if (
+                not isinstance(column.type, Numeric)
+                or isinstance(column.type, Float)
+                or db_type is None
+            ):
+                continue
+            if (
+                isinstance(db_type, Float)
+                or not isinstance(db_type, Numeric)
+                or db_type.precision != column.type.precision
+                or db_type.scale != column.type.scale
+            ):
+                legacy_columns.append((table.name, column.name, column.type))
+    return legacy_columns
+
+
+def catch_up_indexes_and_prices(connection: Connection) -> None:
+    """
+    Brings a database created before the index and price changes in
+    line with the models.
+
+    Creates the missing indexes with IF NOT EXISTS and converts the
+    sale price columns to numeric(12, 2). Deploys run this with the app
+    stopped, so the indexes are built inside the migration transaction
+    rather than CONCURRENTLY.
+    """
+    quote = connection.dialect.identifier_preparer.quote
+    for table_name, column_name, column_type in legacy_numeric_columns(
+        connection
+    ):
+        type_sql = column_type.compile(dialect=connection.dialect)
+        logger.info(
+            "Converting %s.%s to %s", table_name, column_name, type_sql
+        )
+        connection.execute(text(
+            f"ALTER TABLE {quote(table_name)} "
+            f"ALTER COLUMN {quote(column_name)} TYPE {type_sql} "
+            f"USING round({quote(column_name)}::numeric, "
+            f"{column_type.scale})"
+        ))
+
+    for index in missing_indexes(connection):
+        logger.info("Creating index %s", index.name)
+        connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+MIGRATIONS: tuple[
+    tuple[str, Callable[[Connection], bool], Callable[[Connection], None]],
+    ...
+] = (
+    (
+        "0001_uuid_ids",
+        lambda connection: bool(legacy_id_columns(connection)),
+        convert_ids_to_uuid,
+    ),
+    (
+        "0002_indexes_and_sale_prices",
+        lambda connection: bool(
+            missing_indexes(connection)
+            or legacy_numeric_columns(connection)
+        ),
+        catch_up_indexes_and_prices,
+    ),
+)
+
+
+def pending_migrations(connection: Connection) -> list[str]:
+    """Returns the names of the migrations the database still needs."""
+    return [
+        name
+        for name, is_pending, _ in MIGRATIONS
+        if is_pending(connection)
+    ]
+
+
+def apply_migrations(connection: Connection) -> None:
+    """
+    Applies every pending migration inside the caller's transaction.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {"key": MIGRATION_LOCK_KEY},
+        )
+    for name, is_pending, apply in MIGRATIONS:
+        if is_pending(connection):
+            logger.info("Applying migration %s", name)
+            apply(connection)
@@ -7,7 +7,7 @@ Product model.
 from sqlalchemy.orm import mapped_column, relationship
 from sqlalchemy import ForeignKey, String, Float
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 from models.brand import brand_products
 
 
@@ -19,12 +19,14 @@ class Product(BaseModel, Base):
     name = mapped_column(String(500), nullable=False, unique=True)
     selling_price = mapped_column(Float, default=0.00)
     category_id = mapped_column(
-        String(36),
+        UUIDStr,
         ForeignKey("categories.id", ondelete="SET NULL"),
+        index=True,
     )
     employee_id = mapped_column(
-        String(36),
-        ForeignKey("employees.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("employees.id", ondelete="SET NULL"),
+        index=True,
     )
     category = relationship("Category", back_populates="products")
     brands = relationship(
@@ -36,4 +38,4 @@ class Product(BaseModel, Base):
     sales = relationship("Sale", back_populates="product")
     purchases = relationship("PurchaseOrderItem", back_populates="product")
     stock_levels = relationship("StockLevel", back_populates="product")
-    added_by = relationship("Employee", backref="products_added")
+    added_by = relationship("Employee", back_populates="products_added")
@@ -5,10 +5,10 @@ Purchase order model.
 """
 
 from sqlalchemy.orm import mapped_column, relationship
-from sqlalchemy import ForeignKey, String, Enum
+from sqlalchemy import ForeignKey, Enum
 import enum
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 
 
 class OrderStatus(enum.Enum):
@@ -30,16 +30,18 @@ class PurchaseOrder(BaseModel, Base):
         default="pending"
     )
     brand_id = mapped_column(
-        String(36),
+        UUIDStr,
         ForeignKey("brands.id", ondelete="SET NULL"),
+        index=True,
     )
     employee_id = mapped_column(
-        String(36),
-        ForeignKey("employees.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("employees.id", ondelete="SET NULL"),
+        index=True,
     )
 
     purchase_order_items = relationship(
         "PurchaseOrderItem", back_populates="purchase_order"
     )
     brand = relationship("Brand", back_populates="purchase_orders")
-    added_by = relationship("Employee", backref="purchase_orders_added")
+    added_by = relationship("Employee", back_populates="purchase_orders_added")
@@ -5,10 +5,10 @@ Purchase order item model and enums.
 """
 
 from sqlalchemy.orm import mapped_column, relationship
-from sqlalchemy import ForeignKey, String, Integer, Float, Enum
+from sqlalchemy import ForeignKey, Integer, Float, Enum
 import enum
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 
 
 class ItemStatus(enum.Enum):
@@ -33,12 +33,14 @@ class PurchaseOrderItem(BaseModel, Base):
     __tablename__ = "purchase_order_items"
 
     purchase_order_id = mapped_column(
-        String(36),
+        UUIDStr,
         ForeignKey("purchase_orders.id", ondelete="SET NULL"),
+        index=True,
     )
     product_id = mapped_column(
-        String(36),
+        UUIDStr,
         ForeignKey("products.id", ondelete="SET NULL"),
+        index=True,
     )
     quantity = mapped_column(Integer, default=0)
     unit_cost_price = mapped_column(Float, default=0)
@@ -5,9 +5,9 @@ Sale model.
 """
 
 from sqlalchemy.orm import mapped_column, relationship
-from sqlalchemy import ForeignKey, String, Integer, Float
+from sqlalchemy import ForeignKey, Integer, Numeric
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 
 
 class Sale(BaseModel, Base):
@@ -16,18 +16,29 @@ class Sale(BaseModel, Base):
     __tablename__ = "sales"
 
     product_id = mapped_column(
-        String(36), ForeignKey("products.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("products.id", ondelete="SET NULL"),
+        index=True,
     )
     brand_id = mapped_column(
-        String(36),
-        ForeignKey("brands.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("brands.id", ondelete="SET NULL"),
+        index=True,
     )
     quantity = mapped_column(Integer, nullable=False)
-    unit_selling_price = mapped_column(Float, nullable=False)
-    total_selling_price = mapped_column(Float, nullable=False)
+    # Exact to the cent in the database; read back as float so the API
+    # and the orjson encoder keep working with plain numbers.
+    unit_selling_price = mapped_column(
+        Numeric(12, 2, asdecimal=False), nullable=False
+    )
+    total_selling_price = mapped_column(
+        Numeric(12, 2, asdecimal=False), nullable=False
+    )
     employee_id = mapped_column(
-        String(36), ForeignKey("employees.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("employees.id", ondelete="SET NULL"),
+        index=True,
     )
     product = relationship("Product", back_populates="sales")
     brand = relationship("Brand", back_populates="sales")
-    added_by = relationship("Employee", backref="sales")
+    added_by = relationship("Employee", back_populates="sales")
@@ -5,9 +5,9 @@ Stock level model.
 """
 
 from sqlalchemy.orm import mapped_column, relationship
-from sqlalchemy import ForeignKey, String, Integer
+from sqlalchemy import ForeignKey, Integer
 
-from models.basemodel import Base, BaseModel
+from models.basemodel import Base, BaseModel, UUIDStr
 
 
 class StockLevel(BaseModel, Base):
@@ -16,11 +16,14 @@ class StockLevel(BaseModel, Base):
     __tablename__ = "stock_levels"
 
     product_id = mapped_column(
-        String(36), ForeignKey("products.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("products.id", ondelete="SET NULL"),
+        index=True,
     )
     brand_id = mapped_column(
-        String(36),
-        ForeignKey("brands.id", ondelete="SET NULL")
+        UUIDStr,
+        ForeignKey("brands.id", ondelete="SET NULL"),
+        index=True,
     )
     current_stock = mapped_column(Integer, default=0)
     product = relationship("Product", back_populates="stock_levels")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+"""
+Shared fixtures for the API test suite.
+
+The suite can run in parallel with pytest-xdist against an in-memory
+database; each worker process then has a database and an admin of its
+own, and `loadfile` keeps each module's class fixtures on one worker:
+
+    ENV=test TEST_DATABASE_URL=sqlite:// pytest -n auto --dist loadfile tests/
+
+SQLite runs enforce foreign keys, but they differ from Postgres in one
+way: `abort_for_db_error` only recognises psycopg2's UniqueViolation,
+so a duplicate that only the database catches (e.g. a repeated brand
+name) is a 500 there rather than a 409. Tests of that behaviour need
+the Postgres settings.
+"""
+
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy.engine import make_url
+from typing import Any, Iterator
+import os
+import pytest
+
+from api.v1.app import create_app
+from models import database_url
+from models.brand import Brand
+from models.category import Category
+from models.employee import Employee
+from models.product import Product
+from models.purchase_order import PurchaseOrder
+
+
+ADMIN_DATA: dict[str, Any] = {
+    "first_name": "Range",
+    "last_name": "Rover",
+    "username": "RRover",
+    "email": "rangerover@gmail.com",
+    "password": "Ranger1234",
+    "home_address": "No. 1 sporty street",
+    "role": "Manager",
+    "is_admin": True,
+}
+
+
+class RecordFactory:
+    """
+    Seeds brands, categories, products and purchase orders straight
+    through the ORM, for tests whose endpoints are elsewhere.
+
+    Records are added to the session but not committed, so a test can
+    seed several and save them with one `storage.save()`.
+    """
+
+    def __init__(self, employee_id: str) -> None:
+        """Seeds every record as added by the given employee."""
+        self.employee_id = employee_id
+
+    def brand(self, name: str = "Emzor") -> Brand:
+        """Adds a brand; names are stored lowercased, as the API does."""
+        return Brand(name=name.lower(), employee_id=self.employee_id)
+
+    def category(self, name: str = "pain killers") -> Category:
+        """Adds a category."""
+        return Category(name=name.lower(), employee_id=self.employee_id)
+
+    def product(
+        self, name: str = "Paracetamol", selling_price: float = 350
+    ) -> Product:
+        """Adds a product."""
+        return Product(
+            name=name.lower(),
+            selling_price=selling_price,
+            employee_id=self.employee_id,
+        )
+
+    def purchase_order(self, brand_id: str) -> PurchaseOrder:
+        """Adds a purchase order from the given brand."""
+        return PurchaseOrder(brand_id=brand_id, employee_id=self.employee_id)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Refuses to start xdist workers on a database they would share.
+
+    Every worker registers the same admin and fixture rows, so on a
+    shared database they would collide on unique constraints.
+    """
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or url.database not in (
+        None, "", ":memory:"
+    ):
+        raise pytest.UsageError(
+            "Parallel runs need TEST_DATABASE_URL=sqlite:// so that each "
+            "worker gets its own in-memory database."
+        )
+
+
+@pytest.fixture(scope="session")
+def admin_client() -> Iterator[tuple[Flask, FlaskClient, str]]:
+    """
+    Builds the test app and logs in one admin user for the whole run.
+
+    Registering and logging in costs two bcrypt rounds, so it is done
+    once instead of in every test class.
+    """
+    from api.v1.utils.utility import get_obj, DatabaseOp
+
+    app = create_app()
+    client = app.test_client()
+
+    client.post("/api/v1/register", json=ADMIN_DATA)
+    response = client.post(
+        "/api/v1/auth_session/login",
+        json={
+            "username": ADMIN_DATA["username"],
+            "password": ADMIN_DATA["password"],
+        },
+    )
+    employee_id = response.get_json().get("employee_id")
+
+    session_cookie = response.headers.get("Set-Cookie")
+    if session_cookie:
+        cookie_name, session_id = (
+            session_cookie.split(";", 1)[0].split("=", 1)
+        )
+        client.set_cookie(cookie_name, session_id)
+
+    yield app, client, employee_id
+
+    employee = get_obj(Employee, employee_id)
+    if not employee:
+        raise ValueError("employee not found")
+    employee.delete()
+    DatabaseOp.commit()
+
+
+@pytest.fixture(scope="class")
+def admin(
+    request: pytest.FixtureRequest,
+    admin_client: tuple[Flask, FlaskClient, str],
+) -> None:
+    """
+    Exposes the shared app, logged-in client and admin on a test class.
+    """
+    request.cls.app, request.cls.client, request.cls.employee_id = (
+        admin_client
+    )
+    request.cls.employee_data = dict(ADMIN_DATA)
+
+
+@pytest.fixture(scope="class")
+def records(
+    request: pytest.FixtureRequest,
+    admin_client: tuple[Flask, FlaskClient, str],
+) -> None:
+    """
+    Exposes a RecordFactory for the shared admin as `records` on a test
+    class.
+    """
+    request.cls.records = RecordFactory(admin_client[2])
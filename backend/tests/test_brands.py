@@ -4,20 +4,18 @@
 Unit tests for the Brand API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
 from typing import Any
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
-from models.employee import Employee
 from models.brand import Brand
 
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin")
 class TestBrand(unittest.TestCase):
     """
     Tests the Brand CRUD and authentication endpoints.
@@ -29,42 +27,6 @@ class TestBrand(unittest.TestCase):
     DELETE - "/api/v1/brands/<brand_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the test app and logs in an admin user.
-        """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        cls.employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=cls.employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
     def setUp(self) -> None:
         """
         Registers a new brand before each test.
@@ -92,21 +54,6 @@ class TestBrand(unittest.TestCase):
         brand.delete()
         db.commit()
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("employee not found")
-        employee.delete()
-        db.commit()
-
     def test_register_brands(self):
         """
         Tests successful brand registration.
@@ -127,6 +74,30 @@ class TestBrand(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertLessEqual(len(response.get_json()), 5)
 
+    def test_get_all_brands_after_cursor(self):
+        """
+        Tests walking the brands one page at a time by cursor.
+        """
+        second = self.client.post("/api/v1/brands", json={"name": "Swipha"})
+        second_id = second.get_json().get("id")
+
+        seen: list[str] = []
+        response = self.client.get("/api/v1/brands/1/1")
+        while response.status_code == 200:
+            seen.extend(brand["id"] for brand in response.get_json())
+            cursor = response.headers["X-Next-Page-After"]
+            self.assertEqual(cursor.rpartition(",")[2], seen[-1])
+            response = self.client.get(f"/api/v1/brands/1/1?after={cursor}")
+        self.assertEqual(response.status_code, 404)
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertIn(self.brand_id, seen)
+        self.assertIn(second_id, seen)
+
+        response = self.client.get("/api/v1/brands/1/1?after=bad")
+        self.assertEqual(response.status_code, 400)
+        self.client.delete(f"/api/v1/brands/{second_id}")
+
     def test_get_brand(self):
         """
         Tests retrieval of a single brand by ID.
@@ -138,6 +109,16 @@ class TestBrand(unittest.TestCase):
             self.brand_data["name"].lower(),
         )
 
+    def test_get_brand_malformed_id(self):
+        """
+        Tests that an ID that is not a UUID is reported as not found.
+        """
+        response = self.client.get("/api/v1/brands/not-a-uuid")
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.delete("/api/v1/brands/not-a-uuid")
+        self.assertEqual(response.status_code, 404)
+
     def test_update_brand(self):
         """
         Tests updating brand details.
@@ -178,6 +159,52 @@ class TestBrand(unittest.TestCase):
         brand = get_obj(Brand, brand_id)
         self.assertIsNone(brand)
 
+    def test_get_brand_after_update_and_delete(self):
+        """
+        Tests that a cached brand is refreshed on update and dropped on
+        delete.
+        """
+        brand_data: dict[str, Any] = {
+            "name": "Fidson",
+        }
+        register_response = self.client.post(
+            "/api/v1/brands",
+            json=brand_data,
+        )
+        brand_id = register_response.get_json().get("id")
+
+        response = self.client.get(f"/api/v1/brands/{brand_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json().get("name"), "fidson")
+
+        self.client.put(
+            f"/api/v1/brands/{brand_id}",
+            json={"name": "Fidson Plc"}
+        )
+        response = self.client.get(f"/api/v1/brands/{brand_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json().get("name"), "fidson plc")
+
+        self.client.delete(f"/api/v1/brands/{brand_id}")
+        response = self.client.get(f"/api/v1/brands/{brand_id}")
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_brand_by_other_id_spelling_after_update(self):
+        """
+        Tests that a brand cached under a non-canonical ID spelling is
+        dropped when it is updated under the canonical one.
+        """
+        upper_id = self.brand_id.upper()
+        response = self.client.get(f"/api/v1/brands/{upper_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json().get("id"), self.brand_id)
+
+        self.client.put(
+            f"/api/v1/brands/{self.brand_id}", json={"name": "Emzor Plc"}
+        )
+        response = self.client.get(f"/api/v1/brands/{upper_id}")
+        self.assertEqual(response.get_json().get("name"), "emzor plc")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
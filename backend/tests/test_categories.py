@@ -4,20 +4,18 @@
 Unit tests for the Category API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
 from typing import Any
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
-from models.employee import Employee
 from models.category import Category
 
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin")
 class TestCategory(unittest.TestCase):
     """
     Tests the Category CRUD and authentication endpoints.
@@ -29,42 +27,6 @@ class TestCategory(unittest.TestCase):
     DELETE - "/api/v1/categories/<category_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the test app and logs in an admin user.
-        """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        cls.employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=cls.employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
     def setUp(self) -> None:
         """
         Registers a new category before each test.
@@ -92,21 +54,6 @@ class TestCategory(unittest.TestCase):
         category.delete()
         db.commit()
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("employee not found")
-        employee.delete()
-        db.commit()
-
     def test_register_categories(self):
         """
         Tests successful category registration.
@@ -4,19 +4,18 @@
 Unit tests for the Employee API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
 from typing import Any
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
 from models.employee import Employee
 
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin")
 class TestEmployee(unittest.TestCase):
     """
     Tests the Employee CRUD and authentication endpoints.
@@ -28,42 +27,6 @@ class TestEmployee(unittest.TestCase):
     DELETE - "/api/v1/employees/<employee_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the test app and logs in an admin user.
-        """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
     def setUp(self) -> None:
         """
         Registers a new employee before each test.
@@ -97,21 +60,6 @@ class TestEmployee(unittest.TestCase):
         employee.delete()
         db.commit()
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("Employee not found")
-        employee.delete()
-        db.commit()
-
     def test_register_employees(self):
         """
         Tests successful employee registration.
@@ -120,6 +68,26 @@ class TestEmployee(unittest.TestCase):
         self.assertEqual(self.response.status_code, 201)
         self.assertNotIn("employee_session", self.response.get_json())
 
+    def test_register_duplicate_employee(self):
+        """
+        Tests that a taken email or username is rejected.
+        """
+        duplicate_email = dict(self.employee_data, username="OtherName")
+        response = self.client.post("/api/v1/register", json=duplicate_email)
+        self.assertEqual(response.status_code, 409)
+
+        duplicate_username = dict(
+            self.employee_data, email="otheremail@gmail.com"
+        )
+        response = self.client.post(
+            "/api/v1/register", json=duplicate_username
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            response.get_json().get("error"),
+            "Username already exists."
+        )
+
     def test_get_all_employees(self):
         """
         Tests retrieval of all employees with pagination.
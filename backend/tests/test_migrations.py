@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+Unit tests for the schema migrations.
+"""
+
+from sqlalchemy import create_engine, inspect, text
+import unittest
+
+from models.basemodel import Base
+from models.engine.migrations import apply_migrations, pending_migrations
+
+
+class TestMigrations(unittest.TestCase):
+    """
+    Tests that an older schema is detected and brought up to date.
+    """
+
+    def setUp(self) -> None:
+        """
+        Creates the current schema in a scratch in-memory database.
+        """
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+
+    def tearDown(self) -> None:
+        """
+        Disposes of the scratch database.
+        """
+        self.engine.dispose()
+
+    def test_missing_indexes_are_created(self):
+        """
+        Tests that a table without its list-page and foreign-key indexes
+        gets them back from migration 0002.
+        """
+        with self.engine.begin() as connection:
+            self.assertEqual(pending_migrations(connection), [])
+
+            connection.execute(text("DROP INDEX ix_sales_created_at_id"))
+            connection.execute(text("DROP INDEX ix_sales_brand_id"))
+            self.assertEqual(
+                pending_migrations(connection),
+                ["0002_indexes_and_sale_prices"],
+            )
+
+            apply_migrations(connection)
+            self.assertEqual(pending_migrations(connection), [])
+            index_names = {
+                index["name"] for index in inspect(connection).get_indexes(
+                    "sales"
+                )
+            }
+        self.assertIn("ix_sales_created_at_id", index_names)
+        self.assertIn("ix_sales_brand_id", index_names)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
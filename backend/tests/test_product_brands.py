@@ -4,15 +4,13 @@
 Unit tests for the Brand API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
+from sqlalchemy.orm import selectinload
 from typing import Any
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
 from models import storage
-from models.employee import Employee
 from models.brand import Brand
 from models.product import Product
 
@@ -20,6 +18,7 @@ from models.product import Product
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin", "records")
 class TestBrand(unittest.TestCase):
     """
     Tests the Brand CRUD and authentication endpoints.
@@ -27,45 +26,10 @@ class TestBrand(unittest.TestCase):
     POST - "/api/v1/products/<product_id>/brands/<brand_id>"
     GET - "/api/v1/products/<product_id>/brands"
     GET - "/api/v1/brands/<brand_id>/products"
+    GET - "/api/v1/brands/<brand_id>?expand=products"
     DELETE - "/api/v1/products/<product_id>/brands/<brand_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the test app and logs in an admin user.
-        """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        cls.employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=cls.employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
     def setUp(self) -> None:
         """
         Registers new brands and new products before each test.
@@ -84,119 +48,122 @@ class TestBrand(unittest.TestCase):
             {"name": "Panadol Extra", "selling_price": 600},
             {"name": "Ibuprofen", "selling_price": 700},
         ]
-        self.brand_ids: list[str] = []
-        self.product_ids: list[str] = []
-
-        for brand_data in self.brands:
-            response = self.client.post(
-                "/api/v1/brands",
-                json=brand_data,
-            )
-            self.brand_ids.append(response.get_json().get("id"))
+        # Seeded straight through the ORM with one commit; the brand and
+        # product endpoints have their own tests.
+        brands = [self.records.brand(**data) for data in self.brands]
+        products = [self.records.product(**data) for data in self.products]
+        storage.save()
 
-        for product_data in self.products:
-            response = self.client.post(
-                "/api/v1/products",
-                json=product_data,
-            )
-            self.product_ids.append(response.get_json().get("id"))
+        self.brand_ids: list[str] = [brand.id for brand in brands]
+        self.product_ids: list[str] = [product.id for product in products]
 
     def tearDown(self) -> None:
         """
         Deletes the brands and products created for each test.
         """
-        for brand_id in self.brand_ids:
-            brand: Brand | None = storage.get_obj_by_id(Brand, brand_id)
-            if not brand:
-                raise ValueError("Brand not found")
-            storage.delete(brand)
-
-        for product_id in self.product_ids:
-            product: Product | None = storage.get_obj_by_id(
-                Product, product_id
-            )
-            if not product:
-                raise ValueError("Product not found")
-            storage.delete(product)
-
+        storage.delete_by_ids(Brand, self.brand_ids)
+        storage.delete_by_ids(Product, self.product_ids)
         storage.save()
 
-    @classmethod
-    def tearDownClass(cls) -> None:
+    def link_all_products_and_brands(self) -> None:
         """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
+        Links every product to every brand with a single commit.
 
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("employee not found")
-        employee.delete()
-        db.commit()
+        Only the endpoint tests go through the API one link at a time.
+        """
+        products = storage.get_objs_of_cls_by_ids(
+            Product,
+            self.product_ids,
+            options=[selectinload(Product.brands)],
+        )
+        brands = storage.get_objs_of_cls_by_ids(Brand, self.brand_ids)
+        for product in products.values():
+            product.brands.extend(brands.values())
+        storage.save()
 
     def test_add_product_brands(self):
         """ """
-        for product_id in self.product_ids:
-            for brand_id in self.brand_ids:
-                response = self.client.post(
-                    f"/api/v1/products/{product_id}/brands/{brand_id}"
-                )
-                self.assertEqual(response.status_code, 201)
+        product_id = self.product_ids[0]
+        for brand_id in self.brand_ids:
+            response = self.client.post(
+                f"/api/v1/products/{product_id}/brands/{brand_id}"
+            )
+            self.assertEqual(response.status_code, 201)
+
+        product: Product | None = storage.get_obj_by_id(Product, product_id)
+        if not product:
+            raise ValueError("Product not found")
+        self.assertCountEqual(
+            self.brand_ids, [brand.id for brand in product.brands]
+        )
 
     def test_get_product_brands(self):
         """ """
-        # add product brands
-        for product_id in self.product_ids:
-            for brand_id in self.brand_ids:
-                self.client.post(
-                    f"/api/v1/products/{product_id}/brands/{brand_id}"
-                )
+        self.link_all_products_and_brands()
 
         # get product brands
         response = self.client.get(
             f"/api/v1/products/{self.product_ids[0]}/brands"
         )
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
         self.assertEqual(
-            response.get_json().get("product_name"),
+            payload.get("product_name"),
             self.products[0]["name"].lower()
         )
 
-        product_brands = response.get_json().get("brands")
+        product_brands = payload.get("brands")
         for brand in self.brands:
             self.assertIn(brand["name"].lower(), product_brands)
 
     def test_get_brand_products(self):
         """ """
-        # add product brands
-        for product_id in self.product_ids:
-            for brand_id in self.brand_ids:
-                self.client.post(
-                    f"/api/v1/products/{product_id}/brands/{brand_id}"
-                )
+        self.link_all_products_and_brands()
 
         # get a brand products
         response = self.client.get(
             f"/api/v1/brands/{self.brand_ids[0]}/products"
         )
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
         self.assertEqual(
-            response.get_json().get("brand_name"),
+            payload.get("brand_name"),
             self.brands[0]["name"].lower()
         )
 
-        brand_products = response.get_json().get("products")
+        brand_products = payload.get("products")
+        for product in self.products:
+            self.assertIn(product["name"].lower(), brand_products)
+
+    def test_get_brand_expand_products(self):
+        """
+        Tests that `?expand=products` adds the linked product names to
+        a single brand.
+        """
+        for product_id in self.product_ids:
+            self.client.post(
+                f"/api/v1/products/{product_id}/brands/{self.brand_ids[0]}"
+            )
+
+        response = self.client.get(
+            f"/api/v1/brands/{self.brand_ids[0]}?expand=products"
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertEqual(
+            payload.get("name"),
+            self.brands[0]["name"].lower()
+        )
+        brand_products = payload.get("products")
         for product in self.products:
             self.assertIn(product["name"].lower(), brand_products)
 
+        response = self.client.get(f"/api/v1/brands/{self.brand_ids[0]}")
+        self.assertNotIn("products", response.get_json())
+
     def test_delete_product_brand(self):
         """ """
-        # add product brands
-        for product_id in self.product_ids:
-            for brand_id in self.brand_ids:
-                self.client.post(
-                    f"/api/v1/products/{product_id}/brands/{brand_id}"
-                )
+        self.link_all_products_and_brands()
 
         for brand_id in self.brand_ids:
             response = self.client.delete(
@@ -4,14 +4,12 @@
 Unit tests for the Product API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
 from typing import Any
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
-from models.employee import Employee
+from models import storage
 from models.product import Product
 from models.category import Category
 
@@ -19,6 +17,7 @@ from models.category import Category
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin", "records")
 class TestProduct(unittest.TestCase):
     """
     Tests the Product CRUD and authentication endpoints.
@@ -30,53 +29,17 @@ class TestProduct(unittest.TestCase):
     DELETE - "/api/v1/products/<product_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the test app and logs in an admin user.
-        """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        cls.employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=cls.employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
     def setUp(self) -> None:
         """
         Registers a new product before each test.
         """
-        # register category
+        # seed the category through the ORM; categories have their own
+        # tests
         self.category_data: dict[str, Any] = {"name": "pain killers"}
-        self.category_response = self.client.post(
-            "/api/v1/categories",
-            json=self.category_data,
-        )
-        self.category_id = self.category_response.get_json().get("id")
+        self.category_id: str = self.records.category(
+            **self.category_data
+        ).id
+        storage.save()
 
         # register product
         self.product_data: dict[str, Any] = {
@@ -110,35 +73,21 @@ class TestProduct(unittest.TestCase):
         category.delete()
         db.commit()
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("employee not found")
-        employee.delete()
-        db.commit()
-
     def test_register_products(self):
         """
         Tests successful product registration.
         """
         self.assertEqual(self.response.status_code, 201)
-        self.assertIn("name", self.response.get_json())
-        self.assertIn("selling_price", self.response.get_json())
+        payload = self.response.get_json()
+        self.assertIn("name", payload)
+        self.assertIn("selling_price", payload)
         self.assertEqual(
             self.category_data["name"].lower(),
-            self.response.get_json().get("category")
+            payload.get("category")
         )
         self.assertEqual(
             self.employee_data["username"].lower(),
-            self.response.get_json().get("added_by"),
+            payload.get("added_by"),
         )
 
     def test_get_all_products(self):
@@ -157,11 +106,12 @@ class TestProduct(unittest.TestCase):
             f"/api/v1/products/{self.product_id}"
         )
         self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
         self.assertEqual(
-            response.get_json().get("name"),
+            payload.get("name"),
             self.product_data["name"].lower(),
         )
-        self.assertEqual(len(response.get_json()), 10)
+        self.assertEqual(len(payload), 10)
 
     def test_update_product(self):
         """
@@ -176,19 +126,50 @@ class TestProduct(unittest.TestCase):
             json=new_data
         )
         self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
         self.assertEqual(
-            response.get_json().get("name"),
+            payload.get("name"),
             new_data["name"].lower()
         )
         self.assertEqual(
-            response.get_json().get("selling_price"),
+            payload.get("selling_price"),
             new_data["selling_price"]
         )
         self.assertEqual(
-            response.get_json().get("category_id"),
+            payload.get("category_id"),
             self.product_data["category_id"]
         )
 
+    def test_update_product_category(self):
+        """
+        Tests moving a product to another category.
+        """
+        from api.v1.utils.utility import get_obj, DatabaseOp
+
+        category_response = self.client.post(
+            "/api/v1/categories",
+            json={"name": "antibiotics"},
+        )
+        category_id = category_response.get_json().get("id")
+
+        response = self.client.put(
+            f"/api/v1/products/{self.product_id}",
+            json={"category_id": category_id}
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertEqual(payload.get("category_id"), category_id)
+        self.assertEqual(payload.get("category"), "antibiotics")
+
+        self.client.put(
+            f"/api/v1/products/{self.product_id}",
+            json={"category_id": self.category_id}
+        )
+        category = get_obj(Category, category_id)
+        if category:
+            category.delete()
+            DatabaseOp.commit()
+
     def test_delete_product(self):
         """
         Tests deleting a product record.
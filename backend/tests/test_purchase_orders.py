@@ -4,14 +4,12 @@
 Unit tests for the PurchaseOrder API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
 from typing import Any
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
-from models.employee import Employee
+from models import storage
 from models.brand import Brand
 from models.purchase_order import PurchaseOrder
 
@@ -19,6 +17,7 @@ from models.purchase_order import PurchaseOrder
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin", "records")
 class TestOrder(unittest.TestCase):
     """
     Tests the Order CRUD and authentication endpoints.
@@ -30,55 +29,16 @@ class TestOrder(unittest.TestCase):
     DELETE - "/api/v1/purchase_orders/<order_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the test app and logs in an admin user.
-        """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        cls.employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=cls.employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
     def setUp(self) -> None:
         """
         Creates a new purchase order before each test.
         """
-        # create brand
+        # seed the brand through the ORM; brands have their own tests
         self.brand_data: dict[str, Any] = {
             "name": "Emzor",
         }
-        self.brand_response = self.client.post(
-            "/api/v1/brands",
-            json=self.brand_data,
-        )
-        self.brand_id: str = self.brand_response.get_json().get("id")
+        self.brand_id: str = self.records.brand(**self.brand_data).id
+        storage.save()
 
         # creete purchase order
         self.order_data: dict[str, str] = {"brand_id": self.brand_id}
@@ -92,37 +52,9 @@ class TestOrder(unittest.TestCase):
         """
         Deletes the purchase order created for each test.
         """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        brand: Brand | None = get_obj(Brand, self.brand_id)
-        order: PurchaseOrder | None = get_obj(
-            PurchaseOrder, self.order_id
-        )
-
-        if not brand:
-            raise ValueError("Brand not found.")
-        if not order:
-            raise ValueError("Order not found.")
-        brand.delete()
-        order.delete()
-        db.commit()
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("employee not found")
-        employee.delete()
-        db.commit()
+        storage.delete_by_id(PurchaseOrder, self.order_id)
+        storage.delete_by_id(Brand, self.brand_id)
+        storage.save()
 
     def test_register_orders(self):
         """
@@ -4,22 +4,22 @@
 Unit tests for the Sale API endpoints.
 """
 
-from flask import Flask
-from flask.testing import FlaskClient
 from typing import Any
+from uuid import uuid4
 import logging
+import pytest
 import unittest
 
-from api.v1.app import create_app
 from models import storage
 from models.brand import Brand
-from models.employee import Employee
 from models.product import Product
+from models.sale import Sale
 
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.mark.usefixtures("admin", "records")
 class TestSale(unittest.TestCase):
     """
     Tests the Sale CRUD and authentication endpoints.
@@ -31,90 +31,19 @@ class TestSale(unittest.TestCase):
     DELETE - "/api/v1/sales/<sale_id>"
     """
 
-    @classmethod
-    def setUpClass(cls) -> None:
+    def setUp(self) -> None:
         """
-        Sets up the test app and logs in an admin user.
+        Registers a new sale before each test.
         """
-        cls.app: Flask = create_app()
-        cls.client: FlaskClient = cls.app.test_client()
-
-        cls.employee_data: dict[str, Any] = {
-            "first_name": "Range",
-            "last_name": "Rover",
-            "username": "RRover",
-            "email": "rangerover@gmail.com",
-            "password": "Ranger1234",
-            "home_address": "No. 1 sporty street",
-            "role": "Manager",
-            "is_admin": True,
-        }
-
-        cls.client.post(
-            "/api/v1/register",
-            json=cls.employee_data,
-        )
-        response = cls.client.post(
-            "/api/v1/auth_session/login",
-            json={"username": "RRover", "password": "Ranger1234"},
-        )
-        cls.employee_id = response.get_json().get("employee_id")
-
-        session_cookie = response.headers.get("Set-Cookie")
-        if session_cookie:
-            cookie_name, session_id = (
-                session_cookie.split(";", 1)[0].split("=", 1)
-            )
-            cls.client.set_cookie(cookie_name, session_id)
-
-    def add_product(self) -> None:
-        """ """
+        self.brand_data = {"name": "Emzor"}
         self.product_data: dict[str, Any] = {
             "name": "Paracetamol",
             "selling_price": 350,
         }
-        response = self.client.post(
-            "/api/v1/products",
-            json=self.product_data,
-        )
-        self.product_id = response.get_json().get("id")
-
-    def delete_product(self) -> None:
-        """ """
-        product: Product | None = storage.get_obj_by_id(
-            Product, self.product_id
-        )
-        if not product:
-            raise ValueError("Product not found")
-
-        storage.delete(product)
+        self.brand_id: str = self.records.brand(**self.brand_data).id
+        self.product_id: str = self.records.product(**self.product_data).id
         storage.save()
 
-    def add_brand(self) -> None:
-        """ """
-        self.brand_data = {"name": "Emzor"}
-        brand_response = self.client.post(
-            "/api/v1/brands",
-            json=self.brand_data,
-        )
-        self.brand_id: str = brand_response.get_json().get("id")
-
-    def delete_brand(self) -> None:
-        """ """
-        brand: Brand | None = storage.get_obj_by_id(Brand, self.brand_id)
-        if not brand:
-            raise ValueError("Brand not found")
-
-        storage.delete(brand)
-        storage.save()
-
-    def setUp(self) -> None:
-        """
-        Registers a new sale before each test.
-        """
-        self.add_brand()
-        self.add_product()
-
         quantity = 50
         unit_cost = 200
         self.sale_data: dict[str, Any] = {
@@ -134,24 +63,10 @@ class TestSale(unittest.TestCase):
         """
         Deletes the sale created for each test.
         """
-        self.client.delete(f"/api/v1/sales/{self.sale_id}")
-        self.delete_brand()
-        self.delete_product()
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """
-        Deletes the admin user created for the test class.
-        """
-        from api.v1.utils.utility import get_obj, DatabaseOp
-
-        db = DatabaseOp()
-
-        employee = get_obj(Employee, cls.employee_id)
-        if not employee:
-            raise ValueError("employee not found")
-        employee.delete()
-        db.commit()
+        storage.delete_by_id(Sale, self.sale_id)
+        storage.delete_by_id(Brand, self.brand_id)
+        storage.delete_by_id(Product, self.product_id)
+        storage.save()
 
     def test_register_sales(self):
         """
@@ -200,6 +115,25 @@ class TestSale(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertLessEqual(len(response.get_json()), 5)
 
+    def test_get_all_sales_after_update(self):
+        """
+        Tests that a cached page of sales is refreshed after an update.
+        """
+        response = self.client.get("/api/v1/sales/100/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            self.sale_id, [sale["id"] for sale in response.get_json()]
+        )
+
+        self.client.put(f"/api/v1/sales/{self.sale_id}", json={"quantity": 7})
+
+        response = self.client.get("/api/v1/sales/100/1")
+        sale = next(
+            sale for sale in response.get_json()
+            if sale["id"] == self.sale_id
+        )
+        self.assertEqual(sale["quantity"], 7)
+
     def test_get_sale(self):
         """
         Tests retrieval of a single sale by ID.
@@ -261,6 +195,16 @@ class TestSale(unittest.TestCase):
             new_data["total_selling_price"],
         )
 
+    def test_update_sale_missing_brand(self):
+        """
+        Tests that updating a sale to an unknown brand is a 404.
+        """
+        response = self.client.put(
+            f"/api/v1/sales/{self.sale_id}", json={"brand_id": str(uuid4())}
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("Brand does not exist", response.get_data(as_text=True))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
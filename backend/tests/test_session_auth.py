@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+"""
+Unit tests for the session authentication endpoints.
+"""
+
+from flask import Flask
+from flask.testing import FlaskClient
+from typing import Any
+import logging
+import unittest
+
+from api.v1.app import create_app
+from models.employee import Employee
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestSessionAuth(unittest.TestCase):
+    """
+    Tests the login and logout endpoints.
+
+    POST - "/api/v1/auth_session/login"
+    DELETE - "/api/v1/auth_session/logout"
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Sets up the test app and registers an employee.
+        """
+        cls.app: Flask = create_app()
+        cls.client: FlaskClient = cls.app.test_client()
+
+        cls.employee_data: dict[str, Any] = {
+            "first_name": "Mazda",
+            "last_name": "Miata",
+            "username": "MMiata",
+            "email": "mazdamiata@gmail.com",
+            "password": "Mazda1234",
+            "home_address": "No. 7 roadster street",
+            "role": "salesperson",
+        }
+        response = cls.client.post(
+            "/api/v1/register",
+            json=cls.employee_data,
+        )
+        cls.employee_id = response.get_json().get("id")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Deletes the employee created for the test class.
+        """
+        from api.v1.utils.utility import get_obj, DatabaseOp
+
+        db = DatabaseOp()
+
+        employee = get_obj(Employee, cls.employee_id)
+        if not employee:
+            raise ValueError("Employee not found")
+        employee.delete()
+        db.commit()
+
+    def login(self) -> None:
+        """
+        Logs in the test employee and stores the session cookie.
+        """
+        self.response = self.client.post(
+            "/api/v1/auth_session/login",
+            json={"username": "MMiata", "password": "Mazda1234"},
+        )
+        session_cookie = self.response.headers.get("Set-Cookie")
+        if session_cookie:
+            cookie_name, session_id = (
+                session_cookie.split(";", 1)[0].split("=", 1)
+            )
+            self.client.set_cookie(cookie_name, session_id)
+            self.session_id = session_id
+
+    def test_login(self):
+        """
+        Tests successful login.
+        """
+        self.login()
+        self.assertEqual(self.response.status_code, 201)
+        self.assertEqual(
+            self.response.get_json().get("employee_id"),
+            self.employee_id
+        )
+        self.assertIsNotNone(self.response.headers.get("Set-Cookie"))
+
+    def test_login_without_email_or_username(self):
+        """
+        Tests that a login naming neither email nor username is a 400.
+        """
+        response = self.client.post(
+            "/api/v1/auth_session/login", json={"password": "Mazda1234"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(
+            "Must have either email or username",
+            response.get_data(as_text=True),
+        )
+
+    def test_logout(self):
+        """
+        Tests that a session is no longer accepted after logout.
+        """
+        self.login()
+        response = self.client.get(f"/api/v1/employees/{self.employee_id}")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.delete("/api/v1/auth_session/logout")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f"/api/v1/employees/{self.employee_id}")
+        self.assertEqual(response.status_code, 401)
+
+    def test_logout_seen_by_other_workers(self):
+        """
+        Tests that a logout is honoured by every worker's auth instance,
+        not just the one that handled it.
+        """
+        from api.v1.auth.session_db_auth import SessionDBAuth
+
+        self.login()
+        other_worker_auth = SessionDBAuth()
+        self.assertEqual(
+            other_worker_auth.employee_id_for_session_id(self.session_id),
+            self.employee_id,
+        )
+
+        response = self.client.delete("/api/v1/auth_session/logout")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(
+            other_worker_auth.employee_id_for_session_id(self.session_id)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+
+"""
+WSGI entry point for production servers.
+
+Run with: gunicorn wsgi:app (settings are read from gunicorn.conf.py)
+"""
+
+from api.v1.app import app